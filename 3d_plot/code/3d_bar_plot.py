@@ -10,13 +10,20 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.colors import Normalize
+
+# Resolve data/plot directories once, relative to this file
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, '..', 'data')
+_PLOT_DIR = os.path.join(_HERE, '..', 'plot')
 
 def create_3d_bar_plot():
     """
@@ -41,16 +48,12 @@ def create_3d_bar_plot():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', '3d_bar_data.csv')
+        csv_path = os.path.join(_DATA_DIR, '3d_bar_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
-        # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['x_pos', 'y_pos', 'height']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        # Load only the required columns with explicit dtypes
+        data = read_csv_columns(csv_path, {'x_pos': np.int32, 'y_pos': np.int32, 'height': np.float32})
         
         # Set style and create plot
         set_scientific_style()
@@ -61,16 +64,21 @@ def create_3d_bar_plot():
         # Prepare data
         xpos = data['x_pos'].values
         ypos = data['y_pos'].values
-        zpos = np.zeros_like(xpos)
-        dx = np.ones_like(xpos) * 0.8
-        dy = np.ones_like(ypos) * 0.8
-        dz = data['height'].values
+        # zpos, dx and dy share one contiguous buffer
+        zpos, dx, dy = np.empty((3, xpos.size), dtype=np.float32)
+        zpos.fill(0.0)
+        dx.fill(0.8)
+        dy.fill(0.8)
+        dz = data['height'].to_numpy(dtype=np.float32)
+        dz_min, dz_max, dz_mean = dz.min(), dz.max(), dz.mean()
         
         # Create color map based on height
-        colors = plt.cm.viridis(dz / dz.max())
+        norm = Normalize(vmin=0.0, vmax=dz_max)
+        colors = plt.cm.viridis(norm(dz))
         
         # Create 3D bar plot
-        ax.bar3d(xpos, ypos, zpos, dx, dy, dz, color=colors, alpha=0.8)
+        bars = ax.bar3d(xpos, ypos, zpos, dx, dy, dz, color=colors, alpha=0.8)
+        bars.set_rasterized(True)
         
         # Customize plot
         ax.set_title('3D Bar Plot', fontsize=14, fontweight='bold')
@@ -79,12 +87,13 @@ def create_3d_bar_plot():
         ax.set_zlabel('Height', fontsize=12)
         
         # Add statistics text
-        stats_text = f"Bars: {len(data)}\nHeight range: [{dz.min():.2f}, {dz.max():.2f}]\nMean height: {dz.mean():.2f}"
+        stats_text = f"Bars: {len(data)}\nHeight range: [{dz_min:.2f}, {dz_max:.2f}]\nMean height: {dz_mean:.2f}"
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.5))
         
         plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', '3d_bar_plot.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, '3d_bar_plot.png'),
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
         plt.close()
         return True
         
@@ -10,13 +10,46 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
+
+# Resolve data/plot directories once, relative to this file
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, '..', 'data')
+_PLOT_DIR = os.path.join(_HERE, '..', 'plot')
+
+def _fill_grid(ix, iy, z, nx, ny, mean_z):
+    """
+    Scatter z values onto an (ny, nx) grid using integer grid codes.
+    
+    Cells without a matching point are filled with mean_z. When several
+    points share a cell, the first one in file order wins.
+    """
+    Z = np.full((ny, nx), mean_z, dtype=float)
+    # Sort points by flat cell index so the writes stream through memory
+    linear = iy.astype(np.int64) * nx + ix
+    order = np.argsort(linear, kind='stable')
+    linear = linear[order]
+    # The stable sort keeps file order within a cell; keep only the first point
+    first = np.ones(linear.size, dtype=bool)
+    first[1:] = linear[1:] != linear[:-1]
+    np.put(Z, linear[first], z[order][first])
+    return Z
+
+def _draw_2d_contour(ax, X, Y, Z, levels):
+    """Draw the 2D comparison contour; depends only on the grid and levels."""
+    contour = ax.contour(X, Y, Z, levels=levels, cmap='viridis')
+    ax.clabel(contour, inline=True, fontsize=8)
+    ax.set_title('2D Contour (for comparison)', fontsize=12, fontweight='bold')
+    ax.set_xlabel('X Coordinate', fontsize=10)
+    ax.set_ylabel('Y Coordinate', fontsize=10)
+    return contour
 
 def create_3d_contour_plot():
     """
@@ -40,16 +73,12 @@ def create_3d_contour_plot():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', '3d_contour_data.csv')
+        csv_path = os.path.join(_DATA_DIR, '3d_contour_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
-        # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['x', 'y', 'z']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        # Load only the required columns with explicit dtypes
+        data = read_csv_columns(csv_path, {'x': np.float32, 'y': np.float32, 'z': np.float32})
         
         # Set style and create plot
         set_scientific_style()
@@ -63,37 +92,40 @@ def create_3d_contour_plot():
         x = data['x'].values
         y = data['y'].values
         z = data['z'].values
+        z_min, z_max, z_mean = z.min(), z.max(), z.mean()
+        
+        # Sorted unique coordinates and per-point grid codes in one hash pass each
+        x_codes, x_unique = pd.factorize(x, sort=True)
+        y_codes, y_unique = pd.factorize(y, sort=True)
+        n_cells = len(x_unique) * len(y_unique)
         
-        # Try to create grid for contour
-        try:
-            x_unique = np.unique(x)
-            y_unique = np.unique(y)
-            X, Y = np.meshgrid(x_unique, y_unique)
+        # Scattered point clouds would need a huge, mostly empty grid, and a
+        # constant z has no contour levels; detect both before allocating
+        is_grid = n_cells <= 16 * len(data) and n_cells <= 10_000_000 and z_min < z_max
+        
+        if is_grid:
+            X = np.broadcast_to(x_unique, (len(y_unique), len(x_unique)))
+            Y = np.broadcast_to(y_unique[:, None], X.shape)
+            
+            # Fill the grid in a single pass; missing cells get the mean z value
+            Z = _fill_grid(x_codes, y_codes, z, len(x_unique), len(y_unique), z_mean)
             
-            Z = np.zeros_like(X)
-            for i, xi in enumerate(x_unique):
-                for j, yi in enumerate(y_unique):
-                    mask = (data['x'] == xi) & (data['y'] == yi)
-                    if mask.any():
-                        Z[j, i] = data.loc[mask, 'z'].iloc[0]
-                    else:
-                        Z[j, i] = np.mean(z)
+            # Share one level array between the 3D and 2D contours; mean-filled
+            # cells lie inside [z_min, z_max], so the raw z range bounds Z
+            levels = np.linspace(z_min, z_max, 40)
             
             # Create 3D contour
-            ax1.contour3D(X, Y, Z, 50, cmap='viridis')
+            contour3d = ax1.contour3D(X, Y, Z, levels=levels, cmap='viridis')
+            contour3d.set_rasterized(True)
             
             # 2D contour for comparison
             ax2 = fig.add_subplot(122)
-            contour = ax2.contour(X, Y, Z, 20, cmap='viridis')
-            ax2.clabel(contour, inline=True, fontsize=8)
-            ax2.set_title('2D Contour (for comparison)', fontsize=12, fontweight='bold')
-            ax2.set_xlabel('X Coordinate', fontsize=10)
-            ax2.set_ylabel('Y Coordinate', fontsize=10)
+            _draw_2d_contour(ax2, X, Y, Z, levels[::2])
             
-        except Exception:
+        else:
             # Fallback to scatter plot
             ax1.scatter(x, y, z, c=z, cmap='viridis', s=50)
-            print("⚠️  Warning: Could not create contour grid, using scatter plot instead")
+            print("⚠️  Warning: Data does not form a contour grid, using scatter plot instead")
         
         # Customize 3D plot
         ax1.set_title('3D Contour Plot', fontsize=12, fontweight='bold')
@@ -102,12 +134,13 @@ def create_3d_contour_plot():
         ax1.set_zlabel('Z Coordinate', fontsize=10)
         
         # Add statistics text
-        stats_text = f"Data points: {len(data)}\nZ range: [{z.min():.2f}, {z.max():.2f}]"
+        stats_text = f"Data points: {len(data)}\nZ range: [{z_min:.2f}, {z_max:.2f}]"
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
         
         plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', '3d_contour_plot.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, '3d_contour_plot.png'),
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
         plt.close()
         return True
         
@@ -13,21 +13,181 @@ Chart types:
 - Parametric 3D plot
 """
 
+import csv
 import os
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 import matplotlib.pyplot as plt
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
+from matplotlib.colors import Normalize
+from matplotlib.lines import Line2D
+from scipy.interpolate import griddata
+
+# Resolve data/plot directories once, relative to this file
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, '..', 'data')
+_PLOT_DIR = os.path.join(_HERE, '..', 'plot')
 
 # Add utils to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'utils'))
-from common_utils import set_scientific_style, get_color_palette, save_plot
+sys.path.append(os.path.join(_HERE, '..', '..', 'utils'))
+from common_utils import set_scientific_style, get_color_palette, save_plot, atomic_output_file
+from plot_cache import plot_cache_key
+
+def _prepare_figure(fig, figsize):
+    """Return a cleared, resized fig for reuse, or a new figure if fig is None"""
+    if fig is None:
+        return plt.figure(figsize=figsize)
+    fig.clf()
+    fig.set_size_inches(figsize)
+    return fig
+
+def _release_figure(fig, reuse_fig):
+    """Clear a reused figure for the next plot, or close a figure we created"""
+    if reuse_fig:
+        fig.clf()
+    else:
+        plt.close(fig)
+
+def _read_numeric_csv(csv_path, float_cols, str_cols=()):
+    """
+    Read a plot CSV with narrow dtypes: float32 for coordinates and category
+    for string labels.
+    """
+    dtype = {col: np.float32 for col in float_cols}
+    dtype.update({col: 'category' for col in str_cols})
+    try:
+        # pyarrow's multi-threaded parser is faster on mixed string/float files
+        return pd.read_csv(csv_path, dtype=dtype, engine='pyarrow')
+    except ImportError:
+        # pyarrow is optional; fall back to the default C parser
+        return pd.read_csv(csv_path, dtype=dtype, engine='c')
+
+def _load_numeric(csv_path, columns):
+    """
+    Load purely numeric CSV columns as float32 arrays without building a DataFrame.
+    
+    The header is validated first so missing columns raise the same error as
+    the pandas-based loaders. Files np.loadtxt cannot parse (blank fields,
+    quoted numbers) are read with pandas instead, with blanks as NaN.
+    """
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        header = [name.strip() for name in next(csv.reader(f), [])]
+    missing_columns = [col for col in columns if col not in header]
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {missing_columns}. Required: {columns}")
+    
+    try:
+        values = np.loadtxt(csv_path, delimiter=',', skiprows=1, dtype=np.float32,
+                            usecols=[header.index(col) for col in columns], ndmin=2,
+                            encoding='utf-8-sig')
+    except ValueError:
+        data = pd.read_csv(csv_path, encoding='utf-8-sig',
+                           usecols=lambda name: name.strip() in columns, dtype=np.float32)
+        data.columns = data.columns.str.strip()
+        return tuple(data[col].to_numpy() for col in columns)
+    return tuple(values[:, i] for i in range(len(columns)))
+
+def _load_xyz_with_grid(csv_path):
+    """
+    Load x, y, z from csv_path together with their (X, Y, Z) grid, or None
+    if the points cannot be gridded.
+    
+    Successfully gridded results are cached in a .npz file next to the CSV,
+    keyed by the content hash of the CSV and of this module, so re-runs skip
+    both parsing and gridding until the data or the gridding code changes.
+    """
+    cache_path = os.path.splitext(csv_path)[0] + '_grid_cache.npz'
+    cache_key = plot_cache_key(csv_path, os.path.join(_HERE, '3d_plot.py'))
+    try:
+        with np.load(cache_path) as cache:
+            if cache['key'] == cache_key:
+                return cache['x'], cache['y'], cache['z'], (cache['X'], cache['Y'], cache['Z'])
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        # A missing, truncated or foreign cache file is just a cache miss
+        pass
+    
+    x, y, z = _load_numeric(csv_path, ['x', 'y', 'z'])
+    try:
+        grid = _build_grid(x, y, z)
+    except Exception:
+        # Failures are not cached, so the next run tries to grid again
+        return x, y, z, None
+    
+    X, Y, Z = grid
+    try:
+        # Write to a temp file in the same directory and replace, so a run
+        # killed mid-write never leaves a corrupt cache behind
+        with atomic_output_file(cache_path) as cache_file:
+            np.savez(cache_file, key=cache_key, x=x, y=y, z=z, X=X, Y=Y, Z=Z)
+    except OSError:
+        # A read-only data directory only means there is no cache
+        pass
+    return x, y, z, grid
 
-def create_3d_surface_plot():
+# Largest grid _build_grid fills, in total cells and in cells per data point
+_MAX_GRID_CELLS = 10_000_000
+_MAX_CELLS_PER_POINT = 16
+
+def _build_grid(x, y, z):
+    """
+    Arrange scattered x, y, z columns into X, Y, Z grids for surface-type plots.
+    
+    Cells without an exact (x, y) match are linearly interpolated from the
+    surrounding points (mean z outside their convex hull); when several rows
+    share a cell, the first one wins. Raises ValueError for scattered points
+    whose grid would exceed _MAX_GRID_CELLS or _MAX_CELLS_PER_POINT.
+    """
+    # Sorted unique coordinates and per-point cell codes in one hash pass each
+    ix, x_unique = pd.factorize(x, sort=True)
+    iy, y_unique = pd.factorize(y, sort=True)
+    
+    # Scattered point clouds would need a huge, mostly empty grid to
+    # interpolate; refuse them before allocating, as 3d_contour_plot.py does
+    n_cells = len(x_unique) * len(y_unique)
+    if n_cells > _MAX_CELLS_PER_POINT * len(z) or n_cells > _MAX_GRID_CELLS:
+        raise ValueError(f"Points do not form a grid ({n_cells} cells for {len(z)} points)")
+    
+    X = np.broadcast_to(x_unique, (len(y_unique), len(x_unique)))
+    Y = np.broadcast_to(y_unique[:, None], X.shape)
+    
+    if len(z) == X.size and np.array_equal(x.reshape(X.shape), X) and np.array_equal(y.reshape(X.shape), Y):
+        # Rows already form a dense row-major grid: reshape without scattering
+        Z = z.reshape(X.shape).astype(np.float32)
+    else:
+        # Scatter every point into its cell with one vectorized write; writing in
+        # reverse order leaves the first row of each cell as the final value
+        Z = np.full(X.shape, np.nan, dtype=np.float32)
+        Z[iy[::-1], ix[::-1]] = z[::-1]
+    
+    missing = np.isnan(Z)
+    if missing.any():
+        Z[missing] = griddata((x, y), z,
+                              (X[missing], Y[missing]), method='linear',
+                              fill_value=float(z.mean()))
+    return X, Y, Z
+
+def _coarsen_grid(X, Y, Z, max_grid):
+    """
+    Stride-subsample X, Y, Z so neither axis has more than about max_grid
+    points; 3D draw time grows with the vertex count while the visible
+    detail saturates far below it.
+    """
+    sy = max(1, Z.shape[0] // max_grid)
+    sx = max(1, Z.shape[1] // max_grid)
+    return X[::sy, ::sx], Y[::sy, ::sx], Z[::sy, ::sx]
+
+def create_3d_surface_plot(fig=None, max_grid=200):
     """
     Create a 3D surface plot.
     
+    If fig is given it is cleared and reused instead of creating a new figure.
+    Grids with more than max_grid points along an axis are stride-subsampled.
+    
     Required CSV: ../data/3d_surface_data.csv
     Required columns: x, y, z
     
@@ -48,52 +208,33 @@ def create_3d_surface_plot():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', '3d_surface_data.csv')
+        csv_path = os.path.join(_DATA_DIR, '3d_surface_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['x', 'y', 'z']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        x, y, z, grid = _load_xyz_with_grid(csv_path)
         
         # Set style and create plot
         set_scientific_style()
         
-        fig = plt.figure(figsize=(12, 8))
+        reuse_fig = fig is not None
+        fig = _prepare_figure(fig, (12, 8))
         ax = fig.add_subplot(111, projection='3d')
         
-        # Prepare data for surface plot
-        x = data['x'].values
-        y = data['y'].values
-        z = data['z'].values
-        
         # Try to create a grid if data is not already gridded
         try:
-            # Get unique x and y values
-            x_unique = np.unique(x)
-            y_unique = np.unique(y)
-            
-            # Create meshgrid
-            X, Y = np.meshgrid(x_unique, y_unique)
+            # Arrange the points on an (x, y) grid
+            if grid is None:
+                raise ValueError("Data could not be arranged on a grid")
+            X, Y, Z = _coarsen_grid(*grid, max_grid)
             
-            # Reshape Z to match the grid
-            Z = np.zeros_like(X)
-            for i, xi in enumerate(x_unique):
-                for j, yi in enumerate(y_unique):
-                    # Find corresponding z value
-                    mask = (data['x'] == xi) & (data['y'] == yi)
-                    if mask.any():
-                        Z[j, i] = data.loc[mask, 'z'].iloc[0]
-                    else:
-                        # Interpolate if exact match not found
-                        Z[j, i] = np.mean(z)
-            
-            # Create surface plot
+            # Create surface plot; rcount/ccount let matplotlib subsample the
+            # quads, and skipping edge lines and antialiasing avoids the slow
+            # per-polygon edge pass
             surf = ax.plot_surface(X, Y, Z, cmap='viridis', alpha=0.8, 
-                                 linewidth=0.5, edgecolors='black')
+                                 rcount=100, ccount=100, linewidth=0, rasterized=True,
+                                 antialiased=False)
             
         except Exception:
             # If gridding fails, use scatter plot as fallback
@@ -108,18 +249,18 @@ def create_3d_surface_plot():
         
         # Add colorbar if surface was created
         try:
-            plt.colorbar(surf, ax=ax, shrink=0.5, aspect=20, label='Z Values')
+            fig.colorbar(surf, ax=ax, shrink=0.5, aspect=20, label='Z Values')
         except:
             pass
         
         # Add statistics text
-        stats_text = f"Data points: {len(data)}\nX range: [{x.min():.2f}, {x.max():.2f}]\nY range: [{y.min():.2f}, {y.max():.2f}]\nZ range: [{z.min():.2f}, {z.max():.2f}]"
+        stats_text = f"Data points: {len(z)}\nX range: [{x.min():.2f}, {x.max():.2f}]\nY range: [{y.min():.2f}, {y.max():.2f}]\nZ range: [{z.min():.2f}, {z.max():.2f}]"
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', '3d_surface_plot.png'))
-        plt.close()
+        fig.tight_layout()
+        save_plot(fig, os.path.join(_PLOT_DIR, '3d_surface_plot.png'))
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -137,10 +278,12 @@ def create_3d_surface_plot():
         print(f"❌ Error creating 3D surface plot: {e}")
         return False
 
-def create_3d_scatter_plot():
+def create_3d_scatter_plot(fig=None):
     """
     Create a 3D scatter plot with groups.
     
+    If fig is given it is cleared and reused instead of creating a new figure.
+    
     Required CSV: ../data/3d_scatter_data.csv
     Required columns: x, y, z, group
     
@@ -157,12 +300,12 @@ def create_3d_scatter_plot():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', '3d_scatter_data.csv')
+        csv_path = os.path.join(_DATA_DIR, '3d_scatter_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
+        data = _read_numeric_csv(csv_path, ['x', 'y', 'z'], str_cols=['group'])
         required_columns = ['x', 'y', 'z', 'group']
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
@@ -171,34 +314,36 @@ def create_3d_scatter_plot():
         # Set style and create plot
         set_scientific_style()
         
-        fig = plt.figure(figsize=(12, 8))
+        reuse_fig = fig is not None
+        fig = _prepare_figure(fig, (12, 8))
         ax = fig.add_subplot(111, projection='3d')
         
-        # Get unique groups and colors
-        groups = data['group'].unique()
-        colors = get_color_palette(len(groups))
+        # Encode each point's group as an index into the palette
+        group_codes, groups = pd.factorize(data['group'])
+        colors = np.asarray(get_color_palette(len(groups)))
         
-        # Create scatter plot for each group
-        for i, group in enumerate(groups):
-            group_data = data[data['group'] == group]
-            ax.scatter(group_data['x'], group_data['y'], group_data['z'], 
-                      c=colors[i], label=group, s=60, alpha=0.7)
+        # Draw all groups in a single scatter call
+        ax.scatter(data['x'].to_numpy(), data['y'].to_numpy(), data['z'].to_numpy(),
+                  c=colors[group_codes], s=60, alpha=0.7)
         
         # Customize plot
         ax.set_title('3D Scatter Plot by Groups', fontsize=14, fontweight='bold')
         ax.set_xlabel('X Coordinate', fontsize=12)
         ax.set_ylabel('Y Coordinate', fontsize=12)
         ax.set_zlabel('Z Coordinate', fontsize=12)
-        ax.legend()
+        legend_handles = [Line2D([0], [0], marker='o', linestyle='', color=colors[i],
+                                 alpha=0.7, label=group)
+                          for i, group in enumerate(groups)]
+        ax.legend(handles=legend_handles)
         
         # Add statistics text
         stats_text = f"Groups: {len(groups)}\nTotal points: {len(data)}"
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', '3d_scatter_plot.png'))
-        plt.close()
+        fig.tight_layout()
+        save_plot(fig, os.path.join(_PLOT_DIR, '3d_scatter_plot.png'))
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -215,10 +360,13 @@ def create_3d_scatter_plot():
         print(f"❌ Error creating 3D scatter plot: {e}")
         return False
 
-def create_3d_wireframe_plot():
+def create_3d_wireframe_plot(fig=None, max_grid=200):
     """
     Create a 3D wireframe plot.
     
+    If fig is given it is cleared and reused instead of creating a new figure.
+    Grids with more than max_grid points along an axis are stride-subsampled.
+    
     Required CSV: ../data/3d_wireframe_data.csv
     Required columns: x, y, z
     
@@ -237,45 +385,29 @@ def create_3d_wireframe_plot():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', '3d_wireframe_data.csv')
+        csv_path = os.path.join(_DATA_DIR, '3d_wireframe_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['x', 'y', 'z']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        x, y, z, grid = _load_xyz_with_grid(csv_path)
         
         # Set style and create plot
         set_scientific_style()
         
-        fig = plt.figure(figsize=(12, 8))
+        reuse_fig = fig is not None
+        fig = _prepare_figure(fig, (12, 8))
         ax = fig.add_subplot(111, projection='3d')
         
-        # Prepare data for wireframe plot
-        x = data['x'].values
-        y = data['y'].values
-        z = data['z'].values
-        
         # Try to create a grid
         try:
-            x_unique = np.unique(x)
-            y_unique = np.unique(y)
-            X, Y = np.meshgrid(x_unique, y_unique)
-            
-            Z = np.zeros_like(X)
-            for i, xi in enumerate(x_unique):
-                for j, yi in enumerate(y_unique):
-                    mask = (data['x'] == xi) & (data['y'] == yi)
-                    if mask.any():
-                        Z[j, i] = data.loc[mask, 'z'].iloc[0]
-                    else:
-                        Z[j, i] = np.mean(z)
+            if grid is None:
+                raise ValueError("Data could not be arranged on a grid")
+            X, Y, Z = _coarsen_grid(*grid, max_grid)
             
             # Create wireframe plot
-            ax.plot_wireframe(X, Y, Z, color='blue', alpha=0.7, linewidth=1)
+            ax.plot_wireframe(X, Y, Z, rcount=50, ccount=50, color='blue', alpha=0.7,
+                              linewidth=1, rasterized=True)
             
         except Exception:
             # Fallback to scatter plot
@@ -289,13 +421,13 @@ def create_3d_wireframe_plot():
         ax.set_zlabel('Z Coordinate', fontsize=12)
         
         # Add statistics text
-        stats_text = f"Data points: {len(data)}\nX range: [{x.min():.2f}, {x.max():.2f}]\nY range: [{y.min():.2f}, {y.max():.2f}]\nZ range: [{z.min():.2f}, {z.max():.2f}]"
+        stats_text = f"Data points: {len(z)}\nX range: [{x.min():.2f}, {x.max():.2f}]\nY range: [{y.min():.2f}, {y.max():.2f}]\nZ range: [{z.min():.2f}, {z.max():.2f}]"
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', '3d_wireframe_plot.png'))
-        plt.close()
+        fig.tight_layout()
+        save_plot(fig, os.path.join(_PLOT_DIR, '3d_wireframe_plot.png'))
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -312,10 +444,12 @@ def create_3d_wireframe_plot():
         print(f"❌ Error creating 3D wireframe plot: {e}")
         return False
 
-def create_3d_bar_plot():
+def create_3d_bar_plot(fig=None):
     """
     Create a 3D bar plot.
     
+    If fig is given it is cleared and reused instead of creating a new figure.
+    
     Required CSV: ../data/3d_bar_data.csv
     Required columns: x_pos, y_pos, height
     
@@ -335,33 +469,27 @@ def create_3d_bar_plot():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', '3d_bar_data.csv')
+        csv_path = os.path.join(_DATA_DIR, '3d_bar_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['x_pos', 'y_pos', 'height']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        xpos, ypos, dz = _load_numeric(csv_path, ['x_pos', 'y_pos', 'height'])
         
         # Set style and create plot
         set_scientific_style()
         
-        fig = plt.figure(figsize=(12, 8))
+        reuse_fig = fig is not None
+        fig = _prepare_figure(fig, (12, 8))
         ax = fig.add_subplot(111, projection='3d')
         
         # Prepare data
-        xpos = data['x_pos'].values
-        ypos = data['y_pos'].values
-        zpos = np.zeros_like(xpos)
-        dx = np.ones_like(xpos) * 0.8
-        dy = np.ones_like(ypos) * 0.8
-        dz = data['height'].values
+        zpos = np.zeros(len(xpos), dtype=np.float32)
+        dx = dy = np.full(len(xpos), 0.8, dtype=np.float32)
         
-        # Create color map based on height
-        colors = plt.cm.viridis(dz / dz.max())
+        # Create color map based on height (vmin=0 keeps the dz / dz.max() scale)
+        norm = Normalize(vmin=0.0, vmax=float(dz.max()))
+        colors = plt.cm.viridis(norm(dz))
         
         # Create 3D bar plot
         ax.bar3d(xpos, ypos, zpos, dx, dy, dz, color=colors, alpha=0.8)
@@ -373,13 +501,13 @@ def create_3d_bar_plot():
         ax.set_zlabel('Height', fontsize=12)
         
         # Add statistics text
-        stats_text = f"Bars: {len(data)}\nHeight range: [{dz.min():.2f}, {dz.max():.2f}]\nMean height: {dz.mean():.2f}"
+        stats_text = f"Bars: {len(dz)}\nHeight range: [{dz.min():.2f}, {dz.max():.2f}]\nMean height: {dz.mean():.2f}"
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', '3d_bar_plot.png'))
-        plt.close()
+        fig.tight_layout()
+        save_plot(fig, os.path.join(_PLOT_DIR, '3d_bar_plot.png'))
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -396,10 +524,12 @@ def create_3d_bar_plot():
         print(f"❌ Error creating 3D bar plot: {e}")
         return False
 
-def create_3d_contour_plot():
+def create_3d_contour_plot(fig=None):
     """
     Create a 3D contour plot.
     
+    If fig is given it is cleared and reused instead of creating a new figure.
+    
     Required CSV: ../data/3d_contour_data.csv
     Required columns: x, y, z
     
@@ -418,44 +548,27 @@ def create_3d_contour_plot():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', '3d_contour_data.csv')
+        csv_path = os.path.join(_DATA_DIR, '3d_contour_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['x', 'y', 'z']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        x, y, z, grid = _load_xyz_with_grid(csv_path)
         
         # Set style and create plot
         set_scientific_style()
         
-        fig = plt.figure(figsize=(15, 6))
+        reuse_fig = fig is not None
+        fig = _prepare_figure(fig, (15, 6))
         
         # 3D contour plot
         ax1 = fig.add_subplot(121, projection='3d')
         
-        # Prepare data
-        x = data['x'].values
-        y = data['y'].values
-        z = data['z'].values
-        
         # Try to create grid for contour
         try:
-            x_unique = np.unique(x)
-            y_unique = np.unique(y)
-            X, Y = np.meshgrid(x_unique, y_unique)
-            
-            Z = np.zeros_like(X)
-            for i, xi in enumerate(x_unique):
-                for j, yi in enumerate(y_unique):
-                    mask = (data['x'] == xi) & (data['y'] == yi)
-                    if mask.any():
-                        Z[j, i] = data.loc[mask, 'z'].iloc[0]
-                    else:
-                        Z[j, i] = np.mean(z)
+            if grid is None:
+                raise ValueError("Data could not be arranged on a grid")
+            X, Y, Z = grid
             
             # Create 3D contour
             ax1.contour3D(X, Y, Z, 50, cmap='viridis')
@@ -480,13 +593,13 @@ def create_3d_contour_plot():
         ax1.set_zlabel('Z Coordinate', fontsize=10)
         
         # Add statistics text
-        stats_text = f"Data points: {len(data)}\nZ range: [{z.min():.2f}, {z.max():.2f}]"
+        stats_text = f"Data points: {len(z)}\nZ range: [{z.min():.2f}, {z.max():.2f}]"
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', '3d_contour_plot.png'))
-        plt.close()
+        fig.tight_layout()
+        save_plot(fig, os.path.join(_PLOT_DIR, '3d_contour_plot.png'))
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -503,10 +616,12 @@ def create_3d_contour_plot():
         print(f"❌ Error creating 3D contour plot: {e}")
         return False
 
-def create_parametric_3d_plot():
+def create_parametric_3d_plot(fig=None):
     """
     Create a parametric 3D plot.
     
+    If fig is given it is cleared and reused instead of creating a new figure.
+    
     Required CSV: ../data/parametric_3d_data.csv
     Required columns: t, x, y, z, curve_type
     
@@ -525,12 +640,12 @@ def create_parametric_3d_plot():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'parametric_3d_data.csv')
+        csv_path = os.path.join(_DATA_DIR, 'parametric_3d_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
+        data = _read_numeric_csv(csv_path, ['t', 'x', 'y', 'z'], str_cols=['curve_type'])
         required_columns = ['t', 'x', 'y', 'z', 'curve_type']
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
@@ -539,18 +654,29 @@ def create_parametric_3d_plot():
         # Set style and create plot
         set_scientific_style()
         
-        fig = plt.figure(figsize=(12, 8))
+        reuse_fig = fig is not None
+        fig = _prepare_figure(fig, (12, 8))
         ax = fig.add_subplot(111, projection='3d')
         
         # Get unique curve types
         curve_types = data['curve_type'].unique()
         colors = get_color_palette(len(curve_types))
         
+        # Sort once by (first appearance of curve_type, t) and split into
+        # contiguous per-curve slices; colors and legend keep the CSV order
+        curve_codes, curve_uniques = pd.factorize(data['curve_type'])
+        order = np.lexsort((data['t'].to_numpy(), curve_codes))
+        order = order[curve_codes[order] >= 0]
+        sorted_codes = curve_codes[order]
+        cuts = np.flatnonzero(sorted_codes[1:] != sorted_codes[:-1]) + 1
+        curve_names = curve_uniques[sorted_codes[np.r_[0, cuts]]] if len(order) else []
+        xs = np.split(data['x'].to_numpy()[order], cuts)
+        ys = np.split(data['y'].to_numpy()[order], cuts)
+        zs = np.split(data['z'].to_numpy()[order], cuts)
+        
         # Plot each curve type
-        for i, curve_type in enumerate(curve_types):
-            curve_data = data[data['curve_type'] == curve_type].sort_values('t')
-            ax.plot(curve_data['x'], curve_data['y'], curve_data['z'], 
-                   color=colors[i], linewidth=2, label=curve_type, alpha=0.8)
+        for i, (curve_type, cx, cy, cz) in enumerate(zip(curve_names, xs, ys, zs)):
+            ax.plot(cx, cy, cz, color=colors[i], linewidth=2, label=curve_type, alpha=0.8)
         
         # Customize plot
         ax.set_title('Parametric 3D Plot', fontsize=14, fontweight='bold')
@@ -564,9 +690,9 @@ def create_parametric_3d_plot():
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightpink', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'parametric_3d_plot.png'))
-        plt.close()
+        fig.tight_layout()
+        save_plot(fig, os.path.join(_PLOT_DIR, 'parametric_3d_plot.png'))
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -583,6 +709,37 @@ def create_parametric_3d_plot():
         print(f"❌ Error creating parametric 3D plot: {e}")
         return False
 
+# Input CSV and required columns of each plot, checked up front by main()
+REQUIRED_INPUTS = {
+    "3D Surface Plot": ('3d_surface_data.csv', ['x', 'y', 'z']),
+    "3D Scatter Plot": ('3d_scatter_data.csv', ['x', 'y', 'z', 'group']),
+    "3D Wireframe Plot": ('3d_wireframe_data.csv', ['x', 'y', 'z']),
+    "3D Bar Plot": ('3d_bar_data.csv', ['x_pos', 'y_pos', 'height']),
+    "3D Contour Plot": ('3d_contour_data.csv', ['x', 'y', 'z']),
+    "Parametric 3D Plot": ('parametric_3d_data.csv', ['t', 'x', 'y', 'z', 'curve_type']),
+}
+
+def _check_input(plot_name):
+    """Check a plot's CSV exists and has its required columns, reading only the header"""
+    csv_name, required_columns = REQUIRED_INPUTS[plot_name]
+    csv_path = os.path.join(_DATA_DIR, csv_name)
+    if not os.path.exists(csv_path):
+        print(f"❌ Skipping {plot_name}: required CSV file not found: {csv_path}")
+        return False
+    
+    header = pd.read_csv(csv_path, nrows=0).columns
+    missing_columns = [col for col in required_columns if col not in header]
+    if missing_columns:
+        print(f"❌ Skipping {plot_name}: {csv_name} is missing required columns: "
+              f"{missing_columns}. Required: {required_columns}")
+        return False
+    return True
+
+def _run_plot(plot_function):
+    """Worker entry point: build one plot in its own process and figure"""
+    plot_name, plot_func = plot_function
+    return plot_name, plot_func()
+
 def main():
     """Main function to create all 3D plots."""
     print("🎯 Creating 3D Plots...")
@@ -599,17 +756,35 @@ def main():
     
     successful_plots = 0
     
-    for plot_name, plot_func in plot_functions:
-        print(f"📊 Creating {plot_name}...")
-        if plot_func():
+    # Validate all inputs from their header rows before parsing or rendering anything
+    runnable_plots = [(plot_name, plot_func) for plot_name, plot_func in plot_functions
+                      if _check_input(plot_name)]
+    max_workers = min(len(runnable_plots), os.cpu_count() or 1)
+    
+    if max_workers > 1:
+        # The plots are independent, so render them in separate processes
+        print(f"📊 Creating {len(runnable_plots)} plots in {max_workers} processes...")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_run_plot, runnable_plots))
+    else:
+        # One figure is cleared and reused by every plot instead of reallocated
+        fig = plt.figure(figsize=(12, 8))
+        results = []
+        for plot_name, plot_func in runnable_plots:
+            print(f"📊 Creating {plot_name}...")
+            results.append((plot_name, plot_func(fig)))
+        plt.close(fig)
+    
+    for plot_name, success in results:
+        if success:
             print(f"✅ {plot_name} created successfully!")
             successful_plots += 1
         else:
             print(f"❌ Failed to create {plot_name}")
-        print()
+    print()
     
     print(f"📈 3D Plot Summary: {successful_plots}/{len(plot_functions)} plots created successfully!")
     return successful_plots == len(plot_functions)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -12,11 +12,8 @@ import sys
 import os
 sys.path.append('../../utils')
 
-from common_utils import *
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 def create_parametric_3d_plot():
     """
@@ -44,8 +41,18 @@ def create_parametric_3d_plot():
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
+        # Import the plotting stack only once the data file is known to exist,
+        # so the missing-file error path does not pay for it
+        import matplotlib.pyplot as plt
+        from common_utils import set_scientific_style, get_color_palette, save_plot
+        
         # Load and validate data
-        data = pd.read_csv(csv_path)
+        try:
+            # pyarrow's multi-threaded parser is faster than the default C engine
+            data = pd.read_csv(csv_path, engine='pyarrow')
+        except ImportError:
+            # pyarrow is optional; fall back to the default C parser
+            data = pd.read_csv(csv_path)
         required_columns = ['t', 'x', 'y', 'z', 'curve_type']
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
@@ -61,10 +68,16 @@ def create_parametric_3d_plot():
         curve_types = data['curve_type'].unique()
         colors = get_color_palette(len(curve_types))
         
+        # Sort once by (first appearance of curve_type, t) and walk the groups
+        # instead of masking and re-sorting the full frame for every curve;
+        # colors and legend keep the CSV order
+        curve_codes = pd.factorize(data['curve_type'])[0]
+        sorted_data = data.iloc[np.lexsort((data['t'].to_numpy(), curve_codes))]
+        
         # Plot each curve type
-        for i, curve_type in enumerate(curve_types):
-            curve_data = data[data['curve_type'] == curve_type].sort_values('t')
-            ax.plot(curve_data['x'], curve_data['y'], curve_data['z'], 
+        for i, (curve_type, curve_data) in enumerate(sorted_data.groupby('curve_type', sort=False)):
+            ax.plot(curve_data['x'].to_numpy(dtype=np.float32), curve_data['y'].to_numpy(dtype=np.float32),
+                   curve_data['z'].to_numpy(dtype=np.float32), 
                    color=colors[i], linewidth=2, label=curve_type, alpha=0.8)
         
         # Customize plot
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+3D Plot Batch Renderer
+======================
+
+Renders every 3D plot in a single interpreter so that numpy/pandas/matplotlib
+are imported only once for the whole batch.
+
+Author: Scientific Plotting Team
+"""
+
+import sys
+import os
+import functools
+import importlib.util
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(_HERE, '..', '..', 'utils'))
+
+# (plot name, script file, plot function) - script names start with a digit,
+# so they are loaded by path rather than with a regular import
+PLOT_REGISTRY = [
+    ("3D Surface Plot", "3d_plot.py", "create_3d_surface_plot"),
+    ("3D Scatter Plot", "3d_plot.py", "create_3d_scatter_plot"),
+    ("3D Wireframe Plot", "3d_plot.py", "create_3d_wireframe_plot"),
+    ("3D Bar Plot", "3d_bar_plot.py", "create_3d_bar_plot"),
+    ("3D Contour Plot", "3d_contour_plot.py", "create_3d_contour_plot"),
+    ("Parametric 3D Plot", "parametric_3d_plot.py", "create_parametric_3d_plot"),
+]
+
+@functools.lru_cache(maxsize=None)
+def _load_script(script_name):
+    """Load a script in this directory as a module, once per script"""
+    module_name = os.path.splitext(script_name)[0]
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(_HERE, script_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def _load_plot_function(script_name, func_name):
+    """Load a plot function from a script in this directory"""
+    return getattr(_load_script(script_name), func_name)
+
+def render_all():
+    """Render every registered plot and return True if all succeeded"""
+    successful_plots = 0
+
+    for plot_name, script_name, func_name in PLOT_REGISTRY:
+        print(f"📊 Creating {plot_name}...")
+        plot_func = _load_plot_function(script_name, func_name)
+        if plot_func():
+            print(f"✅ {plot_name} created successfully!")
+            successful_plots += 1
+        else:
+            print(f"❌ Failed to create {plot_name}")
+
+    print(f"📈 Batch Summary: {successful_plots}/{len(PLOT_REGISTRY)} plots created successfully!")
+    return successful_plots == len(PLOT_REGISTRY)
+
+
+def main():
+    """Render every registered 3D plot."""
+    return render_all()
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -17,16 +17,48 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import functools
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 
-def create_basic_bar_chart():
-    """创建基础柱状图"""
+@functools.lru_cache(maxsize=None)
+def _load_csv(csv_path, required_columns, data_description):
+    """
+    加载并缓存CSV数据，同一进程内重复调用时不再重新解析文件
+    
+    required_columns 需为元组以便作为缓存键；返回的DataFrame是共享的，调用方不应原地修改
+    """
+    return check_and_load_csv(csv_path, list(required_columns), data_description)
+
+# 按颜色数缓存的配色方案，同一进程内每种长度只生成一次
+_PALETTES = {}
+
+def _palette(n_colors):
+    """返回缓存的n色配色方案（调用方不应修改返回的列表）"""
+    if n_colors not in _PALETTES:
+        _PALETTES[n_colors] = get_color_palette(n_colors)
+    return _PALETTES[n_colors]
+
+def _prepare_figure(fig, figsize=(10, 6)):
+    """传入fig时清空、调整尺寸并复用，否则新建带科学样式的图形"""
+    if fig is None:
+        return create_figure_with_style(figsize=figsize)
+    fig.clf()
+    fig.set_size_inches(figsize)
+    return fig, fig.add_subplot()
+
+def _release_figure(fig, reuse_fig):
+    """只关闭本函数新建的图形，复用的图形由调用方负责关闭"""
+    if not reuse_fig:
+        plt.close(fig)
+
+def create_basic_bar_chart(fig=None):
+    """创建基础柱状图，传入fig时清空并复用该图形"""
     print("\n1. Basic Bar Chart")
     
     csv_path = "../data/basic_bar_data.csv"
@@ -49,20 +81,18 @@ Method D,68
     
     try:
         # 尝试加载CSV数据
-        df = check_and_load_csv(csv_path, required_columns, data_description)
+        df = _load_csv(csv_path, tuple(required_columns), data_description)
         
         # 创建图形
-        fig, ax = create_figure_with_style()
-        colors = get_color_palette(len(df))
+        reuse_fig = fig is not None
+        fig, ax = _prepare_figure(fig)
+        colors = _palette(len(df))
         
         # 绘制柱状图
         bars = ax.bar(df['category'], df['value'], color=colors, alpha=0.8)
         
-        # 添加数值标签
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                   f'{height:.0f}', ha='center', va='bottom')
+        # 添加数值标签（bar_label一次性标注整个容器）
+        ax.bar_label(bars, fmt='%.0f', padding=3)
         
         ax.set_xlabel('Category')
         ax.set_ylabel('Value')
@@ -70,8 +100,9 @@ Method D,68
         ax.grid(True, alpha=0.3, axis='y')
         
         # 保存图片
-        save_plot(fig, "../plot/basic_bar_chart.png")
-        plt.close()
+        save_plot(fig, "../plot/basic_bar_chart.png",
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
+        _release_figure(fig, reuse_fig)
         
     except (FileNotFoundError, ValueError) as e:
         print(f"❌ 无法创建基础柱状图: {str(e)}")
@@ -79,8 +110,8 @@ Method D,68
     
     return True
 
-def create_grouped_bar_chart():
-    """创建分组柱状图"""
+def create_grouped_bar_chart(fig=None):
+    """创建分组柱状图，传入fig时清空并复用该图形"""
     print("\n2. Grouped Bar Chart")
     
     csv_path = "../data/grouped_bar_data.csv"
@@ -105,11 +136,12 @@ Q4,88,91,77
     
     try:
         # 尝试加载CSV数据
-        df = check_and_load_csv(csv_path, required_columns, data_description)
+        df = _load_csv(csv_path, tuple(required_columns), data_description)
         
         # 创建图形
-        fig, ax = create_figure_with_style(figsize=(12, 6))
-        colors = get_color_palette(3)
+        reuse_fig = fig is not None
+        fig, ax = _prepare_figure(fig, figsize=(12, 6))
+        colors = _palette(3)
         
         # 设置柱子位置
         x = np.arange(len(df['category']))
@@ -129,8 +161,9 @@ Q4,88,91,77
         ax.grid(True, alpha=0.3, axis='y')
         
         # 保存图片
-        save_plot(fig, "../plot/grouped_bar_chart.png")
-        plt.close()
+        save_plot(fig, "../plot/grouped_bar_chart.png",
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
+        _release_figure(fig, reuse_fig)
         
     except (FileNotFoundError, ValueError) as e:
         print(f"❌ 无法创建分组柱状图: {str(e)}")
@@ -138,8 +171,8 @@ Q4,88,91,77
     
     return True
 
-def create_stacked_bar_chart():
-    """创建堆叠柱状图"""
+def create_stacked_bar_chart(fig=None):
+    """创建堆叠柱状图，传入fig时清空并复用该图形"""
     print("\n3. Stacked Bar Chart")
     
     csv_path = "../data/stacked_bar_data.csv"
@@ -164,19 +197,21 @@ Product D,40,20,25
     
     try:
         # 尝试加载CSV数据
-        df = check_and_load_csv(csv_path, required_columns, data_description)
+        df = _load_csv(csv_path, tuple(required_columns), data_description)
         
         # 创建图形
-        fig, ax = create_figure_with_style()
-        colors = get_color_palette(3)
+        reuse_fig = fig is not None
+        fig, ax = _prepare_figure(fig)
+        colors = _palette(3)
+        
+        # 一次性计算各层底部：第i层的底部是前i层的累加和
+        parts = df[['part_a', 'part_b', 'part_c']].to_numpy(copy=False).T
+        bottoms = np.vstack([np.zeros(parts.shape[1]), np.cumsum(parts, axis=0)[:-1]])
         
         # 绘制堆叠柱状图
-        ax.bar(df['category'], df['part_a'], label='Part A', color=colors[0], alpha=0.8)
-        ax.bar(df['category'], df['part_b'], bottom=df['part_a'], 
-               label='Part B', color=colors[1], alpha=0.8)
-        ax.bar(df['category'], df['part_c'], 
-               bottom=df['part_a'] + df['part_b'], 
-               label='Part C', color=colors[2], alpha=0.8)
+        for i, label in enumerate(['Part A', 'Part B', 'Part C']):
+            ax.bar(df['category'], parts[i], bottom=bottoms[i],
+                   label=label, color=colors[i], alpha=0.8)
         
         ax.set_xlabel('Category')
         ax.set_ylabel('Value')
@@ -185,8 +220,9 @@ Product D,40,20,25
         ax.grid(True, alpha=0.3, axis='y')
         
         # 保存图片
-        save_plot(fig, "../plot/stacked_bar_chart.png")
-        plt.close()
+        save_plot(fig, "../plot/stacked_bar_chart.png",
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
+        _release_figure(fig, reuse_fig)
         
     except (FileNotFoundError, ValueError) as e:
         print(f"❌ 无法创建堆叠柱状图: {str(e)}")
@@ -194,8 +230,8 @@ Product D,40,20,25
     
     return True
 
-def create_horizontal_bar_chart():
-    """创建水平柱状图"""
+def create_horizontal_bar_chart(fig=None):
+    """创建水平柱状图，传入fig时清空并复用该图形"""
     print("\n4. Horizontal Bar Chart")
     
     csv_path = "../data/horizontal_bar_data.csv"
@@ -218,23 +254,21 @@ Algorithm D,88
     
     try:
         # 尝试加载CSV数据
-        df = check_and_load_csv(csv_path, required_columns, data_description)
+        df = _load_csv(csv_path, tuple(required_columns), data_description)
         
         # 按分数排序
         df = df.sort_values('score', ascending=True)
         
         # 创建图形
-        fig, ax = create_figure_with_style()
-        colors = get_color_palette(len(df))
+        reuse_fig = fig is not None
+        fig, ax = _prepare_figure(fig)
+        colors = _palette(len(df))
         
         # 绘制水平柱状图
         bars = ax.barh(df['item'], df['score'], color=colors, alpha=0.8)
         
-        # 添加数值标签
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(width + 1, bar.get_y() + bar.get_height()/2.,
-                   f'{width:.0f}', ha='left', va='center')
+        # 添加数值标签（bar_label一次性标注整个容器）
+        ax.bar_label(bars, fmt='%.0f', padding=3)
         
         ax.set_xlabel('Score')
         ax.set_ylabel('Item')
@@ -242,8 +276,9 @@ Algorithm D,88
         ax.grid(True, alpha=0.3, axis='x')
         
         # 保存图片
-        save_plot(fig, "../plot/horizontal_bar_chart.png")
-        plt.close()
+        save_plot(fig, "../plot/horizontal_bar_chart.png",
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
+        _release_figure(fig, reuse_fig)
         
     except (FileNotFoundError, ValueError) as e:
         print(f"❌ 无法创建水平柱状图: {str(e)}")
@@ -251,25 +286,79 @@ Algorithm D,88
     
     return True
 
-def main():
-    """主函数"""
+def create_bar_chart_overview():
+    """将四种柱状图用DataFrame.plot一次性绘制到同一张2x2总览图中"""
+    print("\nBar Chart Overview")
+    
+    data_description = "数据格式同对应的单图（基础/分组/堆叠/水平柱状图）"
+    
+    try:
+        # 尝试加载CSV数据（与单图共用缓存的加载函数）
+        basic_df = _load_csv("../data/basic_bar_data.csv", ('category', 'value'), data_description)
+        grouped_df = _load_csv("../data/grouped_bar_data.csv",
+                               ('category', 'group_a', 'group_b', 'group_c'), data_description)
+        stacked_df = _load_csv("../data/stacked_bar_data.csv",
+                               ('category', 'part_a', 'part_b', 'part_c'), data_description)
+        horizontal_df = _load_csv("../data/horizontal_bar_data.csv", ('item', 'score'), data_description)
+        
+        # 创建2x2图形，四个子图只做一次图形创建和保存
+        set_scientific_style()
+        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        colors = _palette(3)
+        
+        basic_df.plot.bar(x='category', y='value', ax=axes[0, 0], legend=False,
+                          color=_palette(len(basic_df)), alpha=0.8, rot=0)
+        axes[0, 0].set_title('Basic Bar Chart')
+        
+        grouped_df.plot.bar(x='category', y=['group_a', 'group_b', 'group_c'], ax=axes[0, 1],
+                            color=colors, alpha=0.8, rot=0)
+        axes[0, 1].set_title('Grouped Bar Chart')
+        
+        stacked_df.plot.bar(x='category', y=['part_a', 'part_b', 'part_c'], stacked=True,
+                            ax=axes[1, 0], color=colors, alpha=0.8, rot=0)
+        axes[1, 0].set_title('Stacked Bar Chart')
+        
+        horizontal_df.sort_values('score').plot.barh(x='item', y='score', ax=axes[1, 1], legend=False,
+                                                     color=_palette(len(horizontal_df)), alpha=0.8)
+        axes[1, 1].set_title('Horizontal Bar Chart')
+        
+        # 保存图片
+        save_plot(fig, "../plot/bar_chart_overview.png",
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
+        plt.close(fig)
+        
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ 无法创建柱状图总览: {str(e)}")
+        return False
+    
+    return True
+
+def main(overview=False):
+    """主函数，overview为True时只生成一张四合一的总览图；全部成功时返回True"""
     print("Creating Bar Charts...")
     
+    if overview:
+        success = create_bar_chart_overview()
+        if success:
+            print("✅ Bar chart overview created successfully!")
+        else:
+            print("❌ 柱状图总览创建失败，请检查数据文件")
+        return success
+    
     success_count = 0
     total_count = 4
     
+    # 四张图共用一个图形，字体和样式缓存只需预热一次
+    set_scientific_style()
+    fig = plt.figure()
+    
     # 创建各种柱状图
-    if create_basic_bar_chart():
-        success_count += 1
+    for create_chart in (create_basic_bar_chart, create_grouped_bar_chart,
+                         create_stacked_bar_chart, create_horizontal_bar_chart):
+        if create_chart(fig):
+            success_count += 1
     
-    if create_grouped_bar_chart():
-        success_count += 1
-        
-    if create_stacked_bar_chart():
-        success_count += 1
-        
-    if create_horizontal_bar_chart():
-        success_count += 1
+    plt.close(fig)
     
     print(f"\n📊 柱状图创建完成: {success_count}/{total_count} 成功")
     
@@ -277,6 +366,9 @@ def main():
         print("✅ All bar charts created successfully!")
     else:
         print("⚠️ 部分柱状图创建失败，请检查数据文件")
+    
+    return success_count == total_count
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    success = main(overview='--overview' in sys.argv[1:])
+    sys.exit(0 if success else 1) 
\ No newline at end of file
@@ -10,13 +10,12 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
-import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 def create_basic_bar_chart():
     """创建基础柱状图"""
@@ -51,11 +50,8 @@ Method D,68
         # 绘制柱状图
         bars = ax.bar(df['category'], df['value'], color=colors, alpha=0.8)
         
-        # 添加数值标签
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                   f'{height:.0f}', ha='center', va='bottom')
+        # 添加数值标签（bar_label一次性标注整个容器）
+        ax.bar_label(bars, fmt='%.0f', padding=3)
         
         ax.set_xlabel('Category')
         ax.set_ylabel('Value')
@@ -63,7 +59,8 @@ Method D,68
         ax.grid(True, alpha=0.3, axis='y')
         
         # 保存图片
-        save_plot(fig, "../plot/basic_bar_chart.png")
+        save_plot(fig, "../plot/basic_bar_chart.png",
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
         plt.close()
         
     except (FileNotFoundError, ValueError) as e:
@@ -10,13 +10,13 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 def create_grouped_bar_chart():
     """创建分组柱状图"""
@@ -68,7 +68,8 @@ Q4,88,91,77
         ax.grid(True, alpha=0.3, axis='y')
         
         # 保存图片
-        save_plot(fig, "../plot/grouped_bar_chart.png")
+        save_plot(fig, "../plot/grouped_bar_chart.png",
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
         plt.close()
         
     except (FileNotFoundError, ValueError) as e:
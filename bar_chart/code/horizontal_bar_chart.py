@@ -10,13 +10,12 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
-import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 def create_horizontal_bar_chart():
     """创建水平柱状图"""
@@ -54,11 +53,8 @@ Algorithm D,88
         # 绘制水平柱状图
         bars = ax.barh(df['item'], df['score'], color=colors, alpha=0.8)
         
-        # 添加数值标签
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(width + 1, bar.get_y() + bar.get_height()/2.,
-                   f'{width:.0f}', ha='left', va='center')
+        # 添加数值标签（bar_label一次性标注整个容器）
+        ax.bar_label(bars, fmt='%.0f', padding=3)
         
         ax.set_xlabel('Score')
         ax.set_ylabel('Item')
@@ -66,7 +62,8 @@ Algorithm D,88
         ax.grid(True, alpha=0.3, axis='x')
         
         # 保存图片
-        save_plot(fig, "../plot/horizontal_bar_chart.png")
+        save_plot(fig, "../plot/horizontal_bar_chart.png",
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
         plt.close()
         
     except (FileNotFoundError, ValueError) as e:
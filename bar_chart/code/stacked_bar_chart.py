@@ -10,13 +10,13 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 def create_stacked_bar_chart():
     """创建堆叠柱状图"""
@@ -50,13 +50,14 @@ Product D,40,20,25
         fig, ax = create_figure_with_style()
         colors = get_color_palette(3)
         
+        # 一次性计算各层底部：第i层的底部是前i层的累加和
+        parts = df[['part_a', 'part_b', 'part_c']].to_numpy(copy=False).T
+        bottoms = np.vstack([np.zeros(parts.shape[1]), np.cumsum(parts, axis=0)[:-1]])
+        
         # 绘制堆叠柱状图
-        ax.bar(df['category'], df['part_a'], label='Part A', color=colors[0], alpha=0.8)
-        ax.bar(df['category'], df['part_b'], bottom=df['part_a'], 
-               label='Part B', color=colors[1], alpha=0.8)
-        ax.bar(df['category'], df['part_c'], 
-               bottom=df['part_a'] + df['part_b'], 
-               label='Part C', color=colors[2], alpha=0.8)
+        for i, label in enumerate(['Part A', 'Part B', 'Part C']):
+            ax.bar(df['category'], parts[i], bottom=bottoms[i],
+                   label=label, color=colors[i], alpha=0.8)
         
         ax.set_xlabel('Category')
         ax.set_ylabel('Value')
@@ -65,7 +66,8 @@ Product D,40,20,25
         ax.grid(True, alpha=0.3, axis='y')
         
         # 保存图片
-        save_plot(fig, "../plot/stacked_bar_chart.png")
+        save_plot(fig, "../plot/stacked_bar_chart.png",
+                  pil_kwargs={'compress_level': 1, 'optimize': False})
         plt.close()
         
     except (FileNotFoundError, ValueError) as e:
@@ -14,16 +14,128 @@ Chart types:
 
 import os
 import sys
+import functools
+import inspect
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 
-# Add utils to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'utils'))
-from common_utils import set_scientific_style, get_color_palette, save_plot
+# Add utils to path; common_utils pulls in pyplot, so it is imported lazily
+# by the functions that draw
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'utils'))
+from box_stats import compute_box_stats, group_buffer
+from plot_cache import cached_plot
 
-def create_basic_box_plot():
+# Data and output directories, resolved once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, '..', 'data')
+_PLOT_DIR = os.path.join(_HERE, '..', 'plot')
+
+# Helper module whose changes also invalidate previously rendered plots
+_BOX_STATS_PATH = os.path.join(_HERE, 'box_stats.py')
+
+# CSVs above this size are read in chunks of _CSV_CHUNKSIZE rows
+_CHUNKED_READ_BYTES = 100 * 1024 * 1024
+_CSV_CHUNKSIZE = 250_000
+
+# Required columns of each plot's CSV, in the order the error messages list them
+_REQUIRED_COLUMNS = {
+    'basic': ('group', 'value'),
+    'violin': ('category', 'measurement'),
+    'grouped': ('time_point', 'condition', 'response'),
+    'notched': ('method', 'performance'),
+    'horizontal': ('algorithm', 'execution_time'),
+}
+
+# Line style for boxes drawn with bxp, matching seaborn's dark gray outlines
+_BOX_LINE_PROPS = {'color': '0.25', 'linewidth': 1}
+
+# Box fill/edge alpha of the basic and notched box plots, with the black
+# box outline pre-parsed to RGBA
+_BOX_ALPHA = 0.7
+_BOX_EDGE_COLOR = (0.0, 0.0, 0.0, _BOX_ALPHA)
+
+# Largest per-category sample fed to the violin KDE; the density shape does
+# not change visibly beyond this
+_VIOLIN_KDE_MAX_POINTS = 2000
+
+def _kde_sample(values, max_points=_VIOLIN_KDE_MAX_POINTS):
+    """
+    Evenly spaced order statistics of values, at most max_points of them.
+    
+    The sample is deterministic and keeps the minimum and maximum, so the
+    violin still spans the full data range.
+    """
+    if values.size <= max_points:
+        return values
+    x = np.sort(values)
+    return x[np.linspace(0, x.size - 1, max_points).round().astype(np.intp)]
+
+@functools.lru_cache(maxsize=None)
+def _palette(n_colors, alpha=None):
+    """
+    Return the cached n-color palette as a tuple of RGBA tuples.
+    
+    Colors are parsed once here, and alpha (if given) is folded into them, so
+    patches can take them without another color conversion.
+    """
+    import matplotlib.colors as mcolors
+    from common_utils import get_color_palette
+    return tuple(mcolors.to_rgba(color, alpha) for color in get_color_palette(n_colors))
+
+def _check_required_columns(csv_path, required_columns):
+    """Raise ValueError if csv_path's header lacks any of required_columns."""
+    columns = set(pd.read_csv(csv_path, nrows=0).columns)
+    missing_columns = [col for col in required_columns if col not in columns]
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {missing_columns}. "
+                         f"Required: {list(required_columns)}")
+
+def _drop_non_finite(data, value_column):
+    """Drop rows whose value is NaN or infinite, as seaborn skipped them."""
+    finite = np.isfinite(data[value_column].to_numpy())
+    return data if finite.all() else data[finite]
+
+def _read_grouped_chunks(csv_path, group_column, value_column):
+    """
+    Stream csv_path in chunks and collect the finite value_column values per group.
+    
+    Returns the group labels in first-seen order, the values of all groups
+    concatenated group by group, and the group offsets into that buffer.
+    """
+    group_chunks = {}
+    for chunk in pd.read_csv(csv_path, usecols=[group_column, value_column],
+                             dtype={group_column: 'category', value_column: np.float32},
+                             chunksize=_CSV_CHUNKSIZE):
+        chunk = _drop_non_finite(chunk, value_column)
+        for label, chunk_values in chunk.groupby(group_column, sort=False, observed=True)[value_column]:
+            group_chunks.setdefault(label, []).append(chunk_values.to_numpy())
+    
+    labels = list(group_chunks)
+    group_values = [np.concatenate(group_chunks[label]) for label in labels]
+    offsets = np.cumsum([0] + [len(values) for values in group_values])
+    return labels, np.concatenate(group_values), offsets
+
+def _prepare_figure(fig, figsize):
+    """Clear, resize and reuse fig when given, otherwise create a new figure."""
+    if fig is None:
+        import matplotlib.pyplot as plt
+        return plt.subplots(figsize=figsize, layout='constrained')
+    fig.clf()
+    fig.set_size_inches(figsize)
+    return fig, fig.add_subplot()
+
+def _release_figure(fig, reuse_fig):
+    """Close only figures created here; a reused figure is closed by its owner."""
+    if not reuse_fig:
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+
+@cached_plot(os.path.join(_DATA_DIR, 'basic_box_data.csv'), os.path.join(_PLOT_DIR, 'basic_box_plot.png'),
+             _BOX_STATS_PATH)
+def create_basic_box_plot(fig=None):
     """
     Create a basic box plot comparing distributions across groups.
     
@@ -44,38 +156,55 @@ def create_basic_box_plot():
     Group B,27.9
     
     Note: Each group should have multiple data points for meaningful box plots.
+    
+    Pass fig to clear and reuse an existing figure instead of creating one.
     """
     try:
-        # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'basic_box_data.csv')
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
-        
-        # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['group', 'value']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        # A missing CSV surfaces as pandas' own FileNotFoundError
+        csv_path = os.path.join(_DATA_DIR, 'basic_box_data.csv')
+        
+        # Load only the required columns with explicit dtypes
+        required_columns = _REQUIRED_COLUMNS['basic']
+        try:
+            data = pd.read_csv(csv_path, usecols=required_columns,
+                               dtype={'group': 'category', 'value': np.float32})
+        except ValueError:
+            # Report missing columns from the header instead of pandas' usecols error
+            _check_required_columns(csv_path, required_columns)
+            raise
+        # Missing values would turn the quartiles and mean into NaN
+        data = _drop_non_finite(data, 'value')
+        
+        # Import the plotting stack only once the data is loaded, so the
+        # missing-file and bad-column error paths do not pay for it
+        from common_utils import set_scientific_style, save_plot
         
         # Set style and create plot
         set_scientific_style()
-        colors = get_color_palette(len(data['group'].unique()))
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        # Lay values out as one contiguous buffer, group by group in first-seen
+        # order, with offsets marking where each group starts
+        group_labels, values, offsets = group_buffer(data['group'], data['value'].to_numpy())
+        colors = _palette(len(group_labels), _BOX_ALPHA)
+        
+        reuse_fig = fig is not None
+        fig, ax = _prepare_figure(fig, figsize=(10, 6))
+        
+        # Box statistics for all groups from the shared buffer, drawn with bxp
+        # so matplotlib does not recompute them
+        box_stats = compute_box_stats(values, offsets, group_labels)
         
         # Create box plot
-        box_plot = ax.boxplot([data[data['group'] == group]['value'].values 
-                              for group in data['group'].unique()],
-                             labels=data['group'].unique(),
-                             patch_artist=True,
-                             notch=False,
-                             showmeans=True)
-        
-        # Color the boxes
+        box_plot = ax.bxp(box_stats,
+                          patch_artist=True,
+                          shownotches=False,
+                          showmeans=True,
+                          boxprops={'edgecolor': _BOX_EDGE_COLOR})
+        
+        # Color the boxes with the pre-parsed RGBA colors (alpha already folded in)
         for patch, color in zip(box_plot['boxes'], colors):
             patch.set_facecolor(color)
-            patch.set_alpha(0.7)
+            patch.set_rasterized(True)
         
         # Customize plot
         ax.set_title('Basic Box Plot - Distribution Comparison', fontsize=14, fontweight='bold')
@@ -84,13 +213,14 @@ def create_basic_box_plot():
         ax.grid(True, alpha=0.3)
         
         # Add statistics text
-        stats_text = f"Groups: {len(data['group'].unique())}\nTotal samples: {len(data)}"
+        stats_text = f"Groups: {len(group_labels)}\nTotal samples: {len(data)}"
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'basic_box_plot.png'))
-        plt.close()
+        save_plot(fig, os.path.join(_PLOT_DIR, 'basic_box_plot.png'),
+                  pil_kwargs={'compress_level': 1, 'optimize': False},
+                  metadata={'Software': None})
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -108,7 +238,9 @@ def create_basic_box_plot():
         print(f"❌ Error creating basic box plot: {e}")
         return False
 
-def create_violin_plot():
+@cached_plot(os.path.join(_DATA_DIR, 'violin_plot_data.csv'), os.path.join(_PLOT_DIR, 'violin_plot.png'),
+             _BOX_STATS_PATH)
+def create_violin_plot(fig=None):
     """
     Create a violin plot showing distribution density.
     
@@ -127,27 +259,56 @@ def create_violin_plot():
     Type B,18.5
     Type B,19.2
     Type B,17.8
+    
+    Pass fig to clear and reuse an existing figure instead of creating one.
     """
     try:
-        # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'violin_plot_data.csv')
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
-        
-        # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['category', 'measurement']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        # A missing CSV surfaces as pandas' own FileNotFoundError
+        csv_path = os.path.join(_DATA_DIR, 'violin_plot_data.csv')
+        
+        # Load only the required columns with explicit dtypes
+        required_columns = _REQUIRED_COLUMNS['violin']
+        try:
+            data = pd.read_csv(csv_path, usecols=required_columns,
+                               dtype={'category': 'category', 'measurement': np.float32})
+        except ValueError:
+            # Report missing columns from the header instead of pandas' usecols error
+            _check_required_columns(csv_path, required_columns)
+            raise
+        # Missing measurements would turn the KDE and quartiles into NaN
+        data = _drop_non_finite(data, 'measurement')
+        
+        # Import the plotting stack only once the data is loaded, so the
+        # missing-file and bad-column error paths do not pay for it
+        import seaborn as sns
+        from common_utils import set_scientific_style, save_plot
         
         # Set style and create plot
         set_scientific_style()
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Create violin plot
-        sns.violinplot(data=data, x='category', y='measurement', ax=ax, palette='Set2')
+        reuse_fig = fig is not None
+        fig, ax = _prepare_figure(fig, figsize=(10, 6))
+        
+        # One contiguous measurement buffer, category by category in first-seen order
+        categories, values, offsets = group_buffer(data['category'], data['measurement'].to_numpy())
+        positions = np.arange(len(categories))
+        
+        # Create violin plot with a seaborn-style inner box (whiskers, IQR bar
+        # and median point); colors are desaturated as seaborn does. Large
+        # categories are thinned before the KDE, the inner box uses all data
+        parts = ax.violinplot([_kde_sample(values[start:stop]) for start, stop in zip(offsets[:-1], offsets[1:])],
+                              positions=positions, widths=0.8, showextrema=False)
+        for body, color in zip(parts['bodies'], sns.color_palette('Set2', len(categories), desat=0.75)):
+            body.set_facecolor(color)
+            body.set_edgecolor('0.25')
+            body.set_alpha(1)
+        inner = compute_box_stats(values, offsets, categories)
+        ax.vlines(positions, [s['whislo'] for s in inner], [s['whishi'] for s in inner],
+                  color='0.25', linewidth=1.5)
+        ax.vlines(positions, [s['q1'] for s in inner], [s['q3'] for s in inner],
+                  color='0.25', linewidth=5)
+        ax.scatter(positions, [s['med'] for s in inner], color='white', s=8, zorder=3)
+        ax.set_xticks(positions, categories)
         
         # Customize plot
         ax.set_title('Violin Plot - Distribution Density', fontsize=14, fontweight='bold')
@@ -156,13 +317,14 @@ def create_violin_plot():
         ax.grid(True, alpha=0.3)
         
         # Add statistics
-        stats_text = f"Categories: {len(data['category'].unique())}\nTotal measurements: {len(data)}"
+        stats_text = f"Categories: {len(categories)}\nTotal measurements: {len(data)}"
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'violin_plot.png'))
-        plt.close()
+        save_plot(fig, os.path.join(_PLOT_DIR, 'violin_plot.png'),
+                  pil_kwargs={'compress_level': 1, 'optimize': False},
+                  metadata={'Software': None})
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -179,7 +341,9 @@ def create_violin_plot():
         print(f"❌ Error creating violin plot: {e}")
         return False
 
-def create_grouped_box_plot():
+@cached_plot(os.path.join(_DATA_DIR, 'grouped_box_data.csv'), os.path.join(_PLOT_DIR, 'grouped_box_plot.png'),
+             _BOX_STATS_PATH)
+def create_grouped_box_plot(fig=None):
     """
     Create a grouped box plot for multi-factor analysis.
     
@@ -199,27 +363,58 @@ def create_grouped_box_plot():
     T1,Treatment,16.1
     T2,Control,14.2
     T2,Treatment,18.5
+    
+    Pass fig to clear and reuse an existing figure instead of creating one.
     """
     try:
-        # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'grouped_box_data.csv')
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
-        
-        # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['time_point', 'condition', 'response']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        # A missing CSV surfaces as pandas' own FileNotFoundError
+        csv_path = os.path.join(_DATA_DIR, 'grouped_box_data.csv')
+        
+        # Load only the required columns with explicit dtypes
+        required_columns = _REQUIRED_COLUMNS['grouped']
+        try:
+            data = pd.read_csv(csv_path, usecols=required_columns,
+                               dtype={'time_point': 'category', 'condition': 'category', 'response': np.float32})
+        except ValueError:
+            # Report missing columns from the header instead of pandas' usecols error
+            _check_required_columns(csv_path, required_columns)
+            raise
+        # Missing responses would turn the box statistics into NaN
+        data = _drop_non_finite(data, 'response')
+        
+        # Import the plotting stack only once the data is loaded, so the
+        # missing-file and bad-column error paths do not pay for it
+        import seaborn as sns
+        from common_utils import set_scientific_style, save_plot
         
         # Set style and create plot
         set_scientific_style()
         
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # Create grouped box plot
-        sns.boxplot(data=data, x='time_point', y='response', hue='condition', ax=ax, palette='Set1')
+        reuse_fig = fig is not None
+        fig, ax = _prepare_figure(fig, figsize=(12, 6))
+        
+        # Unique levels are computed once and reused for ordering and stats
+        time_points = data['time_point'].unique()
+        conditions = data['condition'].unique()
+        responses = {key: values.to_numpy() for key, values
+                     in data.groupby(['time_point', 'condition'], sort=False, observed=True)['response']}
+        
+        # Create grouped box plot: one bxp call per condition, dodged around
+        # each time point
+        box_width = 0.8 / len(conditions)
+        colors = sns.color_palette('Set1', len(conditions), desat=0.75)
+        for j, (condition, color) in enumerate(zip(conditions, colors)):
+            present = [i for i, time_point in enumerate(time_points) if (time_point, condition) in responses]
+            group_values = [responses[time_points[i], condition] for i in present]
+            offsets = np.cumsum([0] + [len(values) for values in group_values])
+            box_plot = ax.bxp(compute_box_stats(np.concatenate(group_values), offsets, present),
+                              positions=[i + (j - (len(conditions) - 1) / 2) * box_width for i in present],
+                              widths=box_width, patch_artist=True, manage_ticks=False,
+                              boxprops={'facecolor': color, 'edgecolor': '0.25'},
+                              whiskerprops=_BOX_LINE_PROPS, capprops=_BOX_LINE_PROPS,
+                              medianprops=_BOX_LINE_PROPS)
+            box_plot['boxes'][0].set_label(condition)
+        ax.set_xticks(np.arange(len(time_points)), time_points)
         
         # Customize plot
         ax.set_title('Grouped Box Plot - Multi-Factor Analysis', fontsize=14, fontweight='bold')
@@ -229,13 +424,14 @@ def create_grouped_box_plot():
         ax.legend(title='Condition', loc='upper left')
         
         # Add statistics
-        stats_text = f"Time points: {len(data['time_point'].unique())}\nConditions: {len(data['condition'].unique())}\nTotal samples: {len(data)}"
+        stats_text = f"Time points: {len(time_points)}\nConditions: {len(conditions)}\nTotal samples: {len(data)}"
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'grouped_box_plot.png'))
-        plt.close()
+        save_plot(fig, os.path.join(_PLOT_DIR, 'grouped_box_plot.png'),
+                  pil_kwargs={'compress_level': 1, 'optimize': False},
+                  metadata={'Software': None})
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -252,7 +448,9 @@ def create_grouped_box_plot():
         print(f"❌ Error creating grouped box plot: {e}")
         return False
 
-def create_notched_box_plot():
+@cached_plot(os.path.join(_DATA_DIR, 'notched_box_data.csv'), os.path.join(_PLOT_DIR, 'notched_box_plot.png'),
+             _BOX_STATS_PATH)
+def create_notched_box_plot(fig=None):
     """
     Create a notched box plot for statistical significance comparison.
     
@@ -271,38 +469,58 @@ def create_notched_box_plot():
     Method 2,78.9
     Method 2,80.3
     Method 2,77.8
+    
+    Pass fig to clear and reuse an existing figure instead of creating one.
     """
     try:
-        # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'notched_box_data.csv')
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
-        
-        # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['method', 'performance']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        # A missing CSV surfaces as pandas' own FileNotFoundError
+        csv_path = os.path.join(_DATA_DIR, 'notched_box_data.csv')
+        
+        # Load only the required columns with explicit dtypes
+        required_columns = _REQUIRED_COLUMNS['notched']
+        try:
+            data = pd.read_csv(csv_path, usecols=required_columns,
+                               dtype={'method': 'category', 'performance': np.float32})
+        except ValueError:
+            # Report missing columns from the header instead of pandas' usecols error
+            _check_required_columns(csv_path, required_columns)
+            raise
+        # Missing values would turn the quartiles and notches into NaN
+        data = _drop_non_finite(data, 'performance')
+        
+        # Import the plotting stack only once the data is loaded, so the
+        # missing-file and bad-column error paths do not pay for it
+        from common_utils import set_scientific_style, save_plot
         
         # Set style and create plot
         set_scientific_style()
-        colors = get_color_palette(len(data['method'].unique()))
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        # Lay values out as one contiguous buffer, method by method in first-seen
+        # order, with offsets marking where each method starts
+        method_labels, values, offsets = group_buffer(data['method'], data['performance'].to_numpy())
+        colors = _palette(len(method_labels), _BOX_ALPHA)
+        
+        reuse_fig = fig is not None
+        fig, ax = _prepare_figure(fig, figsize=(10, 6))
+        
+        # Box statistics for all methods from the shared buffer, drawn with bxp
+        # so matplotlib does not recompute them
+        box_stats = compute_box_stats(values, offsets, method_labels)
         
         # Create notched box plot
-        box_plot = ax.boxplot([data[data['method'] == method]['performance'].values 
-                              for method in data['method'].unique()],
-                             labels=data['method'].unique(),
-                             patch_artist=True,
-                             notch=True,  # Add notches for confidence intervals
-                             showmeans=True)
-        
-        # Color the boxes
-        for patch, color in zip(box_plot['boxes'], colors):
-            patch.set_facecolor(color)
-            patch.set_alpha(0.7)
+        box_plot = ax.bxp(box_stats,
+                          patch_artist=False,
+                          shownotches=True,  # Add notches for confidence intervals
+                          showmeans=True,
+                          boxprops={'color': _BOX_EDGE_COLOR})
+        
+        # Fill all box outlines in one collection with the pre-parsed RGBA
+        # colors (alpha already folded in), beneath the outlines and medians
+        from matplotlib.collections import PolyCollection
+        ax.add_collection(PolyCollection([box.get_xydata() for box in box_plot['boxes']],
+                                         facecolors=colors, edgecolors='none',
+                                         zorder=1, rasterized=True),
+                          autolim=False)
         
         # Customize plot
         ax.set_title('Notched Box Plot - Statistical Significance', fontsize=14, fontweight='bold')
@@ -315,9 +533,10 @@ def create_notched_box_plot():
         ax.text(0.02, 0.02, explanation, transform=ax.transAxes, 
                 verticalalignment='bottom', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.7))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'notched_box_plot.png'))
-        plt.close()
+        save_plot(fig, os.path.join(_PLOT_DIR, 'notched_box_plot.png'),
+                  pil_kwargs={'compress_level': 1, 'optimize': False},
+                  metadata={'Software': None})
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -334,7 +553,9 @@ def create_notched_box_plot():
         print(f"❌ Error creating notched box plot: {e}")
         return False
 
-def create_horizontal_box_plot():
+@cached_plot(os.path.join(_DATA_DIR, 'horizontal_box_data.csv'), os.path.join(_PLOT_DIR, 'horizontal_box_plot.png'),
+             _BOX_STATS_PATH)
+def create_horizontal_box_plot(fig=None):
     """
     Create a horizontal box plot for algorithm performance comparison.
     
@@ -353,28 +574,59 @@ def create_horizontal_box_plot():
     Algorithm B,0.45
     Algorithm B,0.48
     Algorithm B,0.42
+    
+    Pass fig to clear and reuse an existing figure instead of creating one.
     """
     try:
-        # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'horizontal_box_data.csv')
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
-        
-        # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['algorithm', 'execution_time']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        # A missing CSV surfaces as pandas' own FileNotFoundError
+        csv_path = os.path.join(_DATA_DIR, 'horizontal_box_data.csv')
+        
+        # Load only the required columns with explicit dtypes
+        required_columns = _REQUIRED_COLUMNS['horizontal']
+        try:
+            if os.path.getsize(csv_path) > _CHUNKED_READ_BYTES:
+                # Large run logs are streamed; only per-algorithm values are kept
+                data = None
+                algorithms, values, offsets = _read_grouped_chunks(csv_path, 'algorithm', 'execution_time')
+            else:
+                data = pd.read_csv(csv_path, usecols=required_columns,
+                                   dtype={'algorithm': 'category', 'execution_time': np.float32})
+                # Missing run times would turn the box statistics into NaN
+                data = _drop_non_finite(data, 'execution_time')
+        except ValueError:
+            # Report missing columns from the header instead of pandas' usecols error
+            _check_required_columns(csv_path, required_columns)
+            raise
+        
+        # Import the plotting stack only once the data is loaded, so the
+        # missing-file and bad-column error paths do not pay for it
+        import seaborn as sns
+        from common_utils import set_scientific_style, save_plot
         
         # Set style and create plot
         set_scientific_style()
         
-        fig, ax = plt.subplots(figsize=(10, 8))
+        reuse_fig = fig is not None
+        fig, ax = _prepare_figure(fig, figsize=(10, 8))
         
-        # Create horizontal box plot
-        sns.boxplot(data=data, y='algorithm', x='execution_time', ax=ax, 
-                   palette='viridis', orient='h')
+        if data is not None:
+            # One contiguous run-time buffer, algorithm by algorithm in first-seen order
+            algorithms, values, offsets = group_buffer(data['algorithm'], data['execution_time'].to_numpy())
+        total_runs = int(offsets[-1])
+        
+        # Create horizontal box plot, first algorithm at the top; matplotlib
+        # 3.10 deprecated vert=False in favor of orientation='horizontal'
+        if 'orientation' in inspect.signature(ax.bxp).parameters:
+            orientation = {'orientation': 'horizontal'}
+        else:
+            orientation = {'vert': False}
+        box_plot = ax.bxp(compute_box_stats(values, offsets, algorithms),
+                          **orientation, patch_artist=True, widths=0.8,
+                          boxprops={'edgecolor': '0.25'}, whiskerprops=_BOX_LINE_PROPS,
+                          capprops=_BOX_LINE_PROPS, medianprops=_BOX_LINE_PROPS)
+        for patch, color in zip(box_plot['boxes'], sns.color_palette('viridis', len(algorithms), desat=0.75)):
+            patch.set_facecolor(color)
+        ax.invert_yaxis()
         
         # Customize plot
         ax.set_title('Horizontal Box Plot - Algorithm Performance', fontsize=14, fontweight='bold')
@@ -383,14 +635,15 @@ def create_horizontal_box_plot():
         ax.grid(True, alpha=0.3)
         
         # Add statistics
-        stats_text = f"Algorithms: {len(data['algorithm'].unique())}\nTotal runs: {len(data)}"
+        stats_text = f"Algorithms: {len(algorithms)}\nTotal runs: {total_runs}"
         ax.text(0.98, 0.98, stats_text, transform=ax.transAxes, 
                 verticalalignment='top', horizontalalignment='right',
                 bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'horizontal_box_plot.png'))
-        plt.close()
+        save_plot(fig, os.path.join(_PLOT_DIR, 'horizontal_box_plot.png'),
+                  pil_kwargs={'compress_level': 1, 'optimize': False},
+                  metadata={'Software': None})
+        _release_figure(fig, reuse_fig)
         return True
         
     except FileNotFoundError as e:
@@ -407,6 +660,11 @@ def create_horizontal_box_plot():
         print(f"❌ Error creating horizontal box plot: {e}")
         return False
 
+def _run_plot(plot_function):
+    """Worker entry point: build one plot in its own process and figure."""
+    plot_name, plot_func = plot_function
+    return plot_name, plot_func()
+
 def main():
     """Main function to create all box plots."""
     print("🎯 Creating Box Plots...")
@@ -421,15 +679,33 @@ def main():
     ]
     
     successful_plots = 0
+    max_workers = min(len(plot_functions), os.cpu_count() or 1)
+    
+    if max_workers > 1:
+        # The plots are independent, so render them in separate processes
+        print(f"📊 Creating {len(plot_functions)} plots in {max_workers} processes...")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_run_plot, plot_functions))
+    else:
+        # Apply the style before creating the figure, so it gets the style's
+        # dpi, and draw all plots into it, clearing it between plots
+        import matplotlib.pyplot as plt
+        from common_utils import set_scientific_style
+        set_scientific_style()
+        fig = plt.figure(layout='constrained')
+        results = []
+        for plot_name, plot_func in plot_functions:
+            print(f"📊 Creating {plot_name}...")
+            results.append((plot_name, plot_func(fig=fig)))
+        plt.close(fig)
     
-    for plot_name, plot_func in plot_functions:
-        print(f"📊 Creating {plot_name}...")
-        if plot_func():
+    for plot_name, success in results:
+        if success:
             print(f"✅ {plot_name} created successfully!")
             successful_plots += 1
         else:
             print(f"❌ Failed to create {plot_name}")
-        print()
+    print()
     
     print(f"📈 Box Plot Summary: {successful_plots}/{len(plot_functions)} plots created successfully!")
     return successful_plots == len(plot_functions)
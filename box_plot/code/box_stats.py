@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Box Plot Statistics
+===================
+
+Computes box-plot statistics for many groups at once so the plot scripts
+can draw with ax.bxp instead of letting ax.boxplot recompute them.
+
+Author: Scientific Plotting Team
+"""
+
+import numpy as np
+import pandas as pd
+
+def group_buffer(groups, values):
+    """
+    Lay out values grouped by groups as one contiguous buffer plus offsets.
+    
+    Returns the group labels in first-seen order, the values reordered so
+    each group is contiguous (stable within a group), and offsets such that
+    group i is values[offsets[i]:offsets[i + 1]]. Missing labels are dropped.
+    Input whose rows are already grouped is returned without reordering.
+    """
+    codes, labels = pd.factorize(groups)
+    values = np.asarray(values)
+    present = codes >= 0
+    if not present.all():
+        codes, values = codes[present], values[present]
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(labels)))))
+    # Codes are numbered in first-seen order, so rows that already come grouped
+    # have non-decreasing codes and can be used as they are without a sort
+    if np.all(codes[1:] >= codes[:-1]):
+        return list(labels), values, offsets
+    order = np.argsort(codes, kind='stable')
+    return list(labels), values[order], offsets
+
+def compute_box_stats(values, offsets, labels, whis=1.5):
+    """
+    Compute ax.bxp statistics for every group in a concatenated value buffer.
+
+    Group i is values[offsets[i]:offsets[i + 1]]. Quartiles use linear
+    interpolation, whiskers follow the Tukey rule (furthest points within
+    whis * IQR of the box) and notches use med +/- 1.57 * IQR / sqrt(n),
+    matching matplotlib.cbook.boxplot_stats.
+    """
+    stats = []
+    for label, start, stop in zip(labels, offsets[:-1], offsets[1:]):
+        x = np.sort(values[start:stop])
+        n = x.size
+
+        # Quartiles straight from the sorted slice: one sort instead of a
+        # partition per percentile
+        pos = np.array([0.25, 0.5, 0.75]) * (n - 1)
+        lo = np.floor(pos).astype(np.intp)
+        hi = np.minimum(lo + 1, n - 1)
+        q1, med, q3 = x[lo] + (x[hi] - x[lo]) * (pos - lo)
+        iqr = q3 - q1
+
+        # Whiskers: furthest points inside the Tukey fences, never inside the box
+        i_lo = np.searchsorted(x, q1 - whis * iqr, side='left')
+        i_hi = np.searchsorted(x, q3 + whis * iqr, side='right')
+        whislo = min(x[i_lo], q1) if i_lo < n else q1
+        whishi = max(x[i_hi - 1], q3) if i_hi > 0 else q3
+
+        notch = 1.57 * iqr / np.sqrt(n)
+        stats.append({
+            'label': label,
+            'mean': x.mean(),
+            'med': med,
+            'q1': q1,
+            'q3': q3,
+            'iqr': iqr,
+            'cilo': med - notch,
+            'cihi': med + notch,
+            'whislo': whislo,
+            'whishi': whishi,
+            'fliers': np.concatenate([x[x < whislo], x[x > whishi]]),
+        })
+    return stats
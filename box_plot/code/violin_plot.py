@@ -5,89 +5,15 @@ Violin Plot
 
 Creates a violin plot showing distribution density.
 
+The plotting code lives in box_plot.py; this script only runs that
+implementation so there is a single copy to maintain.
+
 Author: Scientific Plotting Team
 """
 
 import sys
-import os
-sys.path.append('../../utils')
-
-from common_utils import *
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-def create_violin_plot():
-    """
-    Create a violin plot showing distribution density.
-    
-    Required CSV: ../data/violin_plot_data.csv
-    Required columns: category, measurement
-    
-    Data format:
-    - category: Category names (string)
-    - measurement: Numerical measurements (float)
-    
-    Example CSV structure:
-    category,measurement
-    Type A,15.2
-    Type A,16.8
-    Type A,14.9
-    Type B,18.5
-    Type B,19.2
-    Type B,17.8
-    """
-    try:
-        # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'violin_plot_data.csv')
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
-        
-        # Load and validate data
-        data = pd.read_csv(csv_path)
-        required_columns = ['category', 'measurement']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
-        
-        # Set style and create plot
-        set_scientific_style()
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Create violin plot
-        sns.violinplot(data=data, x='category', y='measurement', ax=ax, palette='Set2')
-        
-        # Customize plot
-        ax.set_title('Violin Plot - Distribution Density', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Categories', fontsize=12)
-        ax.set_ylabel('Measurements', fontsize=12)
-        ax.grid(True, alpha=0.3)
-        
-        # Add statistics
-        stats_text = f"Categories: {len(data['category'].unique())}\nTotal measurements: {len(data)}"
-        ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
-                verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
-        
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'violin_plot.png'))
-        plt.close()
-        return True
-        
-    except FileNotFoundError as e:
-        print(f"❌ Error creating violin plot: {e}")
-        print("📋 Required data format for violin_plot_data.csv:")
-        print("   Columns: category, measurement")
-        print("   Example:")
-        print("   category,measurement")
-        print("   Type A,15.2")
-        print("   Type A,16.8")
-        print("   Type B,18.5")
-        return False
-    except Exception as e:
-        print(f"❌ Error creating violin plot: {e}")
-        return False
+from box_plot import create_violin_plot
 
 
 def main():
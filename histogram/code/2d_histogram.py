@@ -10,14 +10,27 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
+from plot_cache import cached_plot
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
+from hist_kernels import DOUBLE_AXES_LAYOUT, bin_2d_histogram_data
 
+# Data and output directories, resolved once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, '..', 'data')
+_PLOT_DIR = os.path.join(_HERE, '..', 'plot')
+
+# Helper module whose changes also invalidate previously rendered plots
+_HIST_KERNELS_PATH = os.path.join(_HERE, 'hist_kernels.py')
+
+@cached_plot(os.path.join(_DATA_DIR, '2d_histogram_data.csv'), os.path.join(_PLOT_DIR, '2d_histogram.png'),
+             _HIST_KERNELS_PATH)
 def create_2d_histogram():
     """
     Create a 2D histogram (heatmap and hexbin plot).
@@ -39,49 +52,45 @@ def create_2d_histogram():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', '2d_histogram_data.csv')
+        csv_path = os.path.join(_DATA_DIR, '2d_histogram_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
-        # Load and validate data
-        data = pd.read_csv(csv_path)
+        # Load, validate and bin the data
         required_columns = ['x', 'y']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        (hist, xedges, yedges, n_points, (x_min, x_max, y_min, y_max),
+         (hb_x, hb_y, hb_weights)) = bin_2d_histogram_data(csv_path, required_columns)
         
         # Set style and create plot
         set_scientific_style()
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6), gridspec_kw=DOUBLE_AXES_LAYOUT)
         
         # 2D Histogram (Heatmap)
-        x, y = data['x'], data['y']
-        
-        # Create 2D histogram
-        hist, xedges, yedges = np.histogram2d(x, y, bins=20)
-        extent = [xedges[0], xedges[-1], yedges[0], yedges[-1]]
-        
-        im1 = ax1.imshow(hist.T, extent=extent, origin='lower', cmap='Blues', aspect='auto')
+        # pcolormesh draws the bin grid as-is, without imshow's resampling pass;
+        # zorder=0 keeps the grid lines on top as they were with imshow
+        im1 = ax1.pcolormesh(xedges, yedges, hist.T, cmap='Blues', shading='flat', zorder=0)
+        ax1.set_xlim(xedges[0], xedges[-1])
+        ax1.set_ylim(yedges[0], yedges[-1])
         ax1.set_title('2D Histogram (Heatmap)', fontsize=12, fontweight='bold')
         ax1.set_xlabel('X Values', fontsize=10)
         ax1.set_ylabel('Y Values', fontsize=10)
         plt.colorbar(im1, ax=ax1, label='Frequency')
         
-        # Hexagonal binning
-        hb = ax2.hexbin(x, y, gridsize=20, cmap='Reds', mincnt=1)
+        # Hexagonal binning of the weighted point sample
+        hb = ax2.hexbin(hb_x, hb_y, C=hb_weights, reduce_C_function=np.sum,
+                        gridsize=20, cmap='Reds', mincnt=1)
         ax2.set_title('2D Histogram (Hexbin)', fontsize=12, fontweight='bold')
         ax2.set_xlabel('X Values', fontsize=10)
         ax2.set_ylabel('Y Values', fontsize=10)
         plt.colorbar(hb, ax=ax2, label='Frequency')
         
         # Add statistics text
-        stats_text = f"Data points: {len(data)}\nX range: [{x.min():.2f}, {x.max():.2f}]\nY range: [{y.min():.2f}, {y.max():.2f}]"
+        stats_text = f"Data points: {n_points}\nX range: [{x_min:.2f}, {x_max:.2f}]\nY range: [{y_min:.2f}, {y_max:.2f}]"
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', '2d_histogram.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, '2d_histogram.png'))
         plt.close()
         return True
         
@@ -10,14 +10,27 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
+from plot_cache import cached_plot
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
+from hist_kernels import SINGLE_AXES_LAYOUT, summary_stats
 
+# Data and output directories, resolved once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, '..', 'data')
+_PLOT_DIR = os.path.join(_HERE, '..', 'plot')
+
+# Helper module whose changes also invalidate previously rendered plots
+_HIST_KERNELS_PATH = os.path.join(_HERE, 'hist_kernels.py')
+
+@cached_plot(os.path.join(_DATA_DIR, 'basic_histogram_data.csv'), os.path.join(_PLOT_DIR, 'basic_histogram.png'),
+             _HIST_KERNELS_PATH)
 def create_basic_histogram():
     """
     Create a basic histogram with normal distribution overlay.
@@ -40,13 +53,14 @@ def create_basic_histogram():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'basic_histogram_data.csv')
+        csv_path = os.path.join(_DATA_DIR, 'basic_histogram_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
         required_columns = ['values']
+        data = load_csv_cached(csv_path, usecols=required_columns,
+                               dtype={'values': np.float64})
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
@@ -54,16 +68,24 @@ def create_basic_histogram():
         # Set style and create plot
         set_scientific_style()
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), gridspec_kw=SINGLE_AXES_LAYOUT)
+        
+        # Convert to one contiguous float64 array that the histogram, the fit
+        # and the statistics text all reuse
+        values = np.ascontiguousarray(data['values'].dropna().to_numpy(dtype=np.float64))
         
         # Create histogram
-        values = data['values'].dropna()
         n, bins, patches = ax.hist(values, bins=30, density=True, alpha=0.7, 
                                   color=get_color_palette(1)[0], edgecolor='black', linewidth=0.5)
         
-        # Fit and plot normal distribution
-        mu, sigma = stats.norm.fit(values)
-        x = np.linspace(values.min(), values.max(), 100)
+        # scipy is only needed here, so it is not imported at module load
+        from scipy import stats
+        
+        # Fit and plot normal distribution; the normal MLE is the mean and the
+        # population (ddof=0) standard deviation, so no iterative fit is needed
+        v_min, v_max, mu, m2 = summary_stats(values)
+        sigma = np.sqrt(m2 / values.size)
+        x = np.linspace(v_min, v_max, 100)
         y = stats.norm.pdf(x, mu, sigma)
         ax.plot(x, y, 'r-', linewidth=2, label=f'Normal fit (μ={mu:.2f}, σ={sigma:.2f})')
         
@@ -75,12 +97,11 @@ def create_basic_histogram():
         ax.legend()
         
         # Add statistics text
-        stats_text = f"Samples: {len(values)}\nMean: {values.mean():.2f}\nStd: {values.std():.2f}"
+        stats_text = f"Samples: {len(values)}\nMean: {mu:.2f}\nStd: {np.sqrt(m2 / (values.size - 1)):.2f}"
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'basic_histogram.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, 'basic_histogram.png'))
         plt.close()
         return True
         
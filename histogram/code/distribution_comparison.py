@@ -10,14 +10,27 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
+from plot_cache import cached_plot
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
+from hist_kernels import DOUBLE_AXES_LAYOUT, quantile_sample
 
+# Data and output directories, resolved once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, '..', 'data')
+_PLOT_DIR = os.path.join(_HERE, '..', 'plot')
+
+# Helper module whose changes also invalidate previously rendered plots
+_HIST_KERNELS_PATH = os.path.join(_HERE, 'hist_kernels.py')
+
+@cached_plot(os.path.join(_DATA_DIR, 'distribution_comparison_data.csv'), os.path.join(_PLOT_DIR, 'distribution_comparison.png'),
+             _HIST_KERNELS_PATH)
 def create_distribution_comparison():
     """
     Create histograms comparing different statistical distributions.
@@ -39,13 +52,14 @@ def create_distribution_comparison():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'distribution_comparison_data.csv')
+        csv_path = os.path.join(_DATA_DIR, 'distribution_comparison_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
         required_columns = ['observed', 'theoretical']
+        data = load_csv_cached(csv_path, usecols=required_columns,
+                               dtype={'observed': np.float64, 'theoretical': np.float64})
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
@@ -54,15 +68,19 @@ def create_distribution_comparison():
         set_scientific_style()
         colors = get_color_palette(2)
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6), gridspec_kw=DOUBLE_AXES_LAYOUT)
         
         # Overlapping histograms
         observed = data['observed'].dropna()
         theoretical = data['theoretical'].dropna()
         
-        ax1.hist(observed, bins=25, alpha=0.6, label='Observed', color=colors[0], 
+        # One set of 25 bins over both samples, so the bars line up and
+        # the edges are only computed once
+        bin_edges = np.histogram_bin_edges([min(observed.min(), theoretical.min()),
+                                            max(observed.max(), theoretical.max())], bins=25)
+        ax1.hist(observed, bins=bin_edges, alpha=0.6, label='Observed', color=colors[0], 
                 density=True, edgecolor='black', linewidth=0.5)
-        ax1.hist(theoretical, bins=25, alpha=0.6, label='Theoretical', color=colors[1], 
+        ax1.hist(theoretical, bins=bin_edges, alpha=0.6, label='Theoretical', color=colors[1], 
                 density=True, edgecolor='black', linewidth=0.5)
         
         ax1.set_title('Distribution Comparison', fontsize=12, fontweight='bold')
@@ -71,9 +89,9 @@ def create_distribution_comparison():
         ax1.grid(True, alpha=0.3)
         ax1.legend()
         
-        # Q-Q plot for comparison
+        # Q-Q plot for comparison; large samples are reduced to 5000 quantiles
         from scipy.stats import probplot
-        probplot(observed, dist="norm", plot=ax2)
+        probplot(quantile_sample(observed), dist="norm", plot=ax2)
         ax2.set_title('Q-Q Plot (Observed vs Normal)', fontsize=12, fontweight='bold')
         ax2.grid(True, alpha=0.3)
         
@@ -84,8 +102,7 @@ def create_distribution_comparison():
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'distribution_comparison.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, 'distribution_comparison.png'))
         plt.close()
         return True
         
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Histogram Kernels
+=================
+
+Vectorized binning and sampling helpers for the histogram scripts, the
+shared CSV reader for the 2D histogram, and the figure margins they share.
+
+Author: Scientific Plotting Team
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from common_utils import load_csv_cached
+
+# Fixed subplot margins; the layouts never change, so no layout solver runs
+SINGLE_AXES_LAYOUT = {'left': 0.08, 'right': 0.95, 'top': 0.92, 'bottom': 0.12}
+DOUBLE_AXES_LAYOUT = {'left': 0.05, 'right': 0.98, 'top': 0.93, 'bottom': 0.1, 'wspace': 0.15}
+
+def _uniform_bin_indices(values, edges):
+    """
+    Bin index of each value for uniform edges, with np.histogram's edge rules.
+    
+    Indices come from one multiply instead of a binary search per value; the
+    two corrections fix values that float rounding puts one bin off, and the
+    last edge is inclusive.
+    """
+    n_bins = edges.size - 1
+    idx = ((values - edges[0]) * (n_bins / (edges[-1] - edges[0]))).astype(np.intp)
+    np.clip(idx, 0, n_bins - 1, out=idx)
+    idx[values < edges[idx]] -= 1
+    idx[(values >= edges[idx + 1]) & (idx != n_bins - 1)] += 1
+    return idx
+
+def histogram2d(x, y, bins=10, edges=None):
+    """
+    Drop-in for np.histogram2d(x, y, bins=int) over the full data range.
+    
+    Returns the same (hist, xedges, yedges); counts are accumulated with one
+    bincount over flattened cell indices. Pass edges=(xedges, yedges) to bin
+    against fixed uniform edges that cover every value instead, e.g. when
+    adding up the chunks of a larger data set.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if edges is None:
+        xedges = np.histogram_bin_edges(x, bins)
+        yedges = np.histogram_bin_edges(y, bins)
+    else:
+        xedges, yedges = edges
+    
+    cells = _uniform_bin_indices(x, xedges) * bins + _uniform_bin_indices(y, yedges)
+    hist = np.bincount(cells, minlength=bins * bins).reshape(bins, bins).astype(np.float64)
+    return hist, xedges, yedges
+
+def quantile_sample(values, max_points=5000):
+    """
+    Reduce values to at most max_points evenly spaced quantiles.
+    
+    Used for Q-Q plots, which are visually saturated long before every
+    order statistic is drawn; the extremes are kept.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.size <= max_points:
+        return values
+    return np.quantile(values, np.linspace(0, 1, max_points))
+
+def summary_stats(values):
+    """
+    Minimum, maximum, mean and sum of squared deviations of a float64 array.
+    
+    The squared deviations are summed with one dot product, so the population
+    and the sample standard deviation both follow from the same pass:
+    sqrt(m2 / n) and sqrt(m2 / (n - 1)).
+    """
+    mean = values.mean()
+    dev = values - mean
+    return values.min(), values.max(), mean, dev @ dev
+
+def subsample_points(x, y, max_points, seed=0):
+    """
+    Random subset of at most max_points (x, y) pairs and the weight of each.
+    
+    Every kept point stands for n / max_points original points, so summing
+    the weights per cell estimates the counts of the full data set.
+    """
+    n = x.size
+    if n <= max_points:
+        return x, y, np.ones(n)
+    keep = np.random.default_rng(seed).choice(n, max_points, replace=False)
+    return x[keep], y[keep], np.full(max_points, n / max_points)
+
+def stream_histogram2d(read_chunks, bins, sample_points, seed=0):
+    """
+    histogram2d plus a weighted point sample for data read chunk by chunk.
+    
+    read_chunks() must return a new iterator of (x, y) float64 array pairs on
+    every call: the data is scanned once for the ranges and once to bin it,
+    so only one chunk is held in memory at a time. The sample keeps about
+    sample_points points at random, weighted like subsample_points.
+    
+    Returns (hist, xedges, yedges, n_points, (x_min, x_max, y_min, y_max),
+    (sample_x, sample_y, sample_weights)).
+    """
+    n_points = 0
+    x_min = y_min = np.inf
+    x_max = y_max = -np.inf
+    for x, y in read_chunks():
+        n_points += x.size
+        # np.minimum/np.maximum propagate NaN, which histogram_bin_edges rejects
+        x_min, x_max = np.minimum(x_min, x.min()), np.maximum(x_max, x.max())
+        y_min, y_max = np.minimum(y_min, y.min()), np.maximum(y_max, y.max())
+    xedges = np.histogram_bin_edges([x_min, x_max], bins)
+    yedges = np.histogram_bin_edges([y_min, y_max], bins)
+    
+    hist = np.zeros((bins, bins))
+    keep_fraction = min(1.0, sample_points / n_points)
+    rng = np.random.default_rng(seed)
+    sample_x, sample_y = [], []
+    for x, y in read_chunks():
+        hist += histogram2d(x, y, bins, edges=(xedges, yedges))[0]
+        keep = rng.random(x.size) < keep_fraction
+        sample_x.append(x[keep])
+        sample_y.append(y[keep])
+    sample_x = np.concatenate(sample_x)
+    sample_y = np.concatenate(sample_y)
+    sample_weights = np.full(sample_x.size, n_points / max(sample_x.size, 1))
+    
+    return (hist, xedges, yedges, n_points, (x_min, x_max, y_min, y_max),
+            (sample_x, sample_y, sample_weights))
+
+# 2D histogram CSVs above this size are streamed in chunks of _CSV_CHUNKSIZE rows
+_CHUNKED_READ_BYTES = 100 * 1024 * 1024
+_CSV_CHUNKSIZE = 250_000
+
+def bin_2d_histogram_data(csv_path, required_columns, bins=20, sample_points=20 * 20 * 50):
+    """
+    Bin the x/y columns of csv_path for the 2D histogram plots.
+    
+    Returns the same tuple as stream_histogram2d. Files above
+    _CHUNKED_READ_BYTES are streamed in chunks instead of loaded whole.
+    """
+    if os.path.getsize(csv_path) > _CHUNKED_READ_BYTES:
+        columns = pd.read_csv(csv_path, nrows=0).columns
+        missing_columns = [col for col in required_columns if col not in columns]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        
+        def read_chunks():
+            for chunk in pd.read_csv(csv_path, usecols=['x', 'y'], dtype=np.float64,
+                                     chunksize=_CSV_CHUNKSIZE):
+                yield chunk['x'].to_numpy(), chunk['y'].to_numpy()
+        
+        return stream_histogram2d(read_chunks, bins, sample_points)
+    
+    data = load_csv_cached(csv_path, usecols=required_columns,
+                           dtype={'x': np.float64, 'y': np.float64})
+    missing_columns = [col for col in required_columns if col not in data.columns]
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+    
+    x, y = data['x'].to_numpy(), data['y'].to_numpy()
+    hist, xedges, yedges = histogram2d(x, y, bins=bins)
+    # Large inputs are subsampled for the hexbin to about 50 points per
+    # hexagon, weighted so the colors still show full-data counts
+    return (hist, xedges, yedges, len(data), (x.min(), x.max(), y.min(), y.max()),
+            subsample_points(x, y, sample_points))
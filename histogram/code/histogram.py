@@ -14,16 +14,30 @@ Chart types:
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-from scipy import stats
 
 # Add utils to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'utils'))
-from common_utils import set_scientific_style, get_color_palette, save_plot
+from common_utils import set_scientific_style, get_color_palette, save_plot, load_csv_cached
+from hist_kernels import (DOUBLE_AXES_LAYOUT, SINGLE_AXES_LAYOUT, bin_2d_histogram_data,
+                          quantile_sample, summary_stats)
+from plot_cache import cached_plot
 
+# Data and output directories, resolved once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, '..', 'data')
+_PLOT_DIR = os.path.join(_HERE, '..', 'plot')
+
+# Helper module whose changes also invalidate previously rendered plots
+_HIST_KERNELS_PATH = os.path.join(_HERE, 'hist_kernels.py')
+
+@cached_plot(os.path.join(_DATA_DIR, 'basic_histogram_data.csv'), os.path.join(_PLOT_DIR, 'basic_histogram.png'),
+             _HIST_KERNELS_PATH)
 def create_basic_histogram():
     """
     Create a basic histogram with normal distribution overlay.
@@ -46,13 +60,14 @@ def create_basic_histogram():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'basic_histogram_data.csv')
+        csv_path = os.path.join(_DATA_DIR, 'basic_histogram_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
         required_columns = ['values']
+        data = load_csv_cached(csv_path, usecols=required_columns,
+                               dtype={'values': np.float64})
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
@@ -60,16 +75,24 @@ def create_basic_histogram():
         # Set style and create plot
         set_scientific_style()
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), gridspec_kw=SINGLE_AXES_LAYOUT)
+        
+        # Convert to one contiguous float64 array that the histogram, the fit
+        # and the statistics text all reuse
+        values = np.ascontiguousarray(data['values'].dropna().to_numpy(dtype=np.float64))
         
         # Create histogram
-        values = data['values'].dropna()
         n, bins, patches = ax.hist(values, bins=30, density=True, alpha=0.7, 
                                   color=get_color_palette(1)[0], edgecolor='black', linewidth=0.5)
         
-        # Fit and plot normal distribution
-        mu, sigma = stats.norm.fit(values)
-        x = np.linspace(values.min(), values.max(), 100)
+        # scipy is only needed here, so it is not imported at module load
+        from scipy import stats
+        
+        # Fit and plot normal distribution; the normal MLE is the mean and the
+        # population (ddof=0) standard deviation, so no iterative fit is needed
+        v_min, v_max, mu, m2 = summary_stats(values)
+        sigma = np.sqrt(m2 / values.size)
+        x = np.linspace(v_min, v_max, 100)
         y = stats.norm.pdf(x, mu, sigma)
         ax.plot(x, y, 'r-', linewidth=2, label=f'Normal fit (μ={mu:.2f}, σ={sigma:.2f})')
         
@@ -81,12 +104,11 @@ def create_basic_histogram():
         ax.legend()
         
         # Add statistics text
-        stats_text = f"Samples: {len(values)}\nMean: {values.mean():.2f}\nStd: {values.std():.2f}"
+        stats_text = f"Samples: {len(values)}\nMean: {mu:.2f}\nStd: {np.sqrt(m2 / (values.size - 1)):.2f}"
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'basic_histogram.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, 'basic_histogram.png'))
         plt.close()
         return True
         
@@ -104,6 +126,8 @@ def create_basic_histogram():
         print(f"❌ Error creating basic histogram: {e}")
         return False
 
+@cached_plot(os.path.join(_DATA_DIR, 'multiple_histogram_data.csv'), os.path.join(_PLOT_DIR, 'multiple_histograms.png'),
+             _HIST_KERNELS_PATH)
 def create_multiple_histograms():
     """
     Create overlapping histograms for multiple groups.
@@ -125,13 +149,14 @@ def create_multiple_histograms():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'multiple_histogram_data.csv')
+        csv_path = os.path.join(_DATA_DIR, 'multiple_histogram_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
         required_columns = ['group_a', 'group_b', 'group_c']
+        data = load_csv_cached(csv_path, usecols=required_columns,
+                               dtype=dict.fromkeys(required_columns, np.float64))
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
@@ -140,7 +165,7 @@ def create_multiple_histograms():
         set_scientific_style()
         colors = get_color_palette(3)
         
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), gridspec_kw=SINGLE_AXES_LAYOUT)
         
         # Create overlapping histograms
         groups = ['group_a', 'group_b', 'group_c']
@@ -167,8 +192,7 @@ def create_multiple_histograms():
         ax.text(0.02, 0.98, stats_text.strip(), transform=ax.transAxes, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'multiple_histograms.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, 'multiple_histograms.png'))
         plt.close()
         return True
         
@@ -187,6 +211,8 @@ def create_multiple_histograms():
         print(f"❌ Error creating multiple histograms: {e}")
         return False
 
+@cached_plot(os.path.join(_DATA_DIR, 'stacked_histogram_data.csv'), os.path.join(_PLOT_DIR, 'stacked_histogram.png'),
+             _HIST_KERNELS_PATH)
 def create_stacked_histogram():
     """
     Create a stacked histogram for categorical data.
@@ -209,13 +235,14 @@ def create_stacked_histogram():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'stacked_histogram_data.csv')
+        csv_path = os.path.join(_DATA_DIR, 'stacked_histogram_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
         required_columns = ['value', 'category']
+        data = load_csv_cached(csv_path, usecols=required_columns,
+                               dtype={'value': np.float64})
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
@@ -223,7 +250,7 @@ def create_stacked_histogram():
         # Set style and create plot
         set_scientific_style()
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), gridspec_kw=SINGLE_AXES_LAYOUT)
         
         # Prepare data for stacked histogram
         categories = data['category'].unique()
@@ -247,8 +274,7 @@ def create_stacked_histogram():
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'stacked_histogram.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, 'stacked_histogram.png'))
         plt.close()
         return True
         
@@ -266,6 +292,8 @@ def create_stacked_histogram():
         print(f"❌ Error creating stacked histogram: {e}")
         return False
 
+@cached_plot(os.path.join(_DATA_DIR, '2d_histogram_data.csv'), os.path.join(_PLOT_DIR, '2d_histogram.png'),
+             _HIST_KERNELS_PATH)
 def create_2d_histogram():
     """
     Create a 2D histogram (heatmap and hexbin plot).
@@ -287,49 +315,45 @@ def create_2d_histogram():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', '2d_histogram_data.csv')
+        csv_path = os.path.join(_DATA_DIR, '2d_histogram_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
-        # Load and validate data
-        data = pd.read_csv(csv_path)
+        # Load, validate and bin the data
         required_columns = ['x', 'y']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        (hist, xedges, yedges, n_points, (x_min, x_max, y_min, y_max),
+         (hb_x, hb_y, hb_weights)) = bin_2d_histogram_data(csv_path, required_columns)
         
         # Set style and create plot
         set_scientific_style()
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6), gridspec_kw=DOUBLE_AXES_LAYOUT)
         
         # 2D Histogram (Heatmap)
-        x, y = data['x'], data['y']
-        
-        # Create 2D histogram
-        hist, xedges, yedges = np.histogram2d(x, y, bins=20)
-        extent = [xedges[0], xedges[-1], yedges[0], yedges[-1]]
-        
-        im1 = ax1.imshow(hist.T, extent=extent, origin='lower', cmap='Blues', aspect='auto')
+        # pcolormesh draws the bin grid as-is, without imshow's resampling pass;
+        # zorder=0 keeps the grid lines on top as they were with imshow
+        im1 = ax1.pcolormesh(xedges, yedges, hist.T, cmap='Blues', shading='flat', zorder=0)
+        ax1.set_xlim(xedges[0], xedges[-1])
+        ax1.set_ylim(yedges[0], yedges[-1])
         ax1.set_title('2D Histogram (Heatmap)', fontsize=12, fontweight='bold')
         ax1.set_xlabel('X Values', fontsize=10)
         ax1.set_ylabel('Y Values', fontsize=10)
         plt.colorbar(im1, ax=ax1, label='Frequency')
         
-        # Hexagonal binning
-        hb = ax2.hexbin(x, y, gridsize=20, cmap='Reds', mincnt=1)
+        # Hexagonal binning of the weighted point sample
+        hb = ax2.hexbin(hb_x, hb_y, C=hb_weights, reduce_C_function=np.sum,
+                        gridsize=20, cmap='Reds', mincnt=1)
         ax2.set_title('2D Histogram (Hexbin)', fontsize=12, fontweight='bold')
         ax2.set_xlabel('X Values', fontsize=10)
         ax2.set_ylabel('Y Values', fontsize=10)
         plt.colorbar(hb, ax=ax2, label='Frequency')
         
         # Add statistics text
-        stats_text = f"Data points: {len(data)}\nX range: [{x.min():.2f}, {x.max():.2f}]\nY range: [{y.min():.2f}, {y.max():.2f}]"
+        stats_text = f"Data points: {n_points}\nX range: [{x_min:.2f}, {x_max:.2f}]\nY range: [{y_min:.2f}, {y_max:.2f}]"
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', '2d_histogram.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, '2d_histogram.png'))
         plt.close()
         return True
         
@@ -347,6 +371,8 @@ def create_2d_histogram():
         print(f"❌ Error creating 2D histogram: {e}")
         return False
 
+@cached_plot(os.path.join(_DATA_DIR, 'distribution_comparison_data.csv'), os.path.join(_PLOT_DIR, 'distribution_comparison.png'),
+             _HIST_KERNELS_PATH)
 def create_distribution_comparison():
     """
     Create histograms comparing different statistical distributions.
@@ -368,13 +394,14 @@ def create_distribution_comparison():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'distribution_comparison_data.csv')
+        csv_path = os.path.join(_DATA_DIR, 'distribution_comparison_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
         required_columns = ['observed', 'theoretical']
+        data = load_csv_cached(csv_path, usecols=required_columns,
+                               dtype={'observed': np.float64, 'theoretical': np.float64})
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
@@ -383,15 +410,19 @@ def create_distribution_comparison():
         set_scientific_style()
         colors = get_color_palette(2)
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6), gridspec_kw=DOUBLE_AXES_LAYOUT)
         
         # Overlapping histograms
         observed = data['observed'].dropna()
         theoretical = data['theoretical'].dropna()
         
-        ax1.hist(observed, bins=25, alpha=0.6, label='Observed', color=colors[0], 
+        # One set of 25 bins over both samples, so the bars line up and
+        # the edges are only computed once
+        bin_edges = np.histogram_bin_edges([min(observed.min(), theoretical.min()),
+                                            max(observed.max(), theoretical.max())], bins=25)
+        ax1.hist(observed, bins=bin_edges, alpha=0.6, label='Observed', color=colors[0], 
                 density=True, edgecolor='black', linewidth=0.5)
-        ax1.hist(theoretical, bins=25, alpha=0.6, label='Theoretical', color=colors[1], 
+        ax1.hist(theoretical, bins=bin_edges, alpha=0.6, label='Theoretical', color=colors[1], 
                 density=True, edgecolor='black', linewidth=0.5)
         
         ax1.set_title('Distribution Comparison', fontsize=12, fontweight='bold')
@@ -400,9 +431,9 @@ def create_distribution_comparison():
         ax1.grid(True, alpha=0.3)
         ax1.legend()
         
-        # Q-Q plot for comparison
+        # Q-Q plot for comparison; large samples are reduced to 5000 quantiles
         from scipy.stats import probplot
-        probplot(observed, dist="norm", plot=ax2)
+        probplot(quantile_sample(observed), dist="norm", plot=ax2)
         ax2.set_title('Q-Q Plot (Observed vs Normal)', fontsize=12, fontweight='bold')
         ax2.grid(True, alpha=0.3)
         
@@ -413,8 +444,7 @@ def create_distribution_comparison():
         fig.text(0.02, 0.98, stats_text, transform=fig.transFigure, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'distribution_comparison.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, 'distribution_comparison.png'))
         plt.close()
         return True
         
@@ -432,6 +462,11 @@ def create_distribution_comparison():
         print(f"❌ Error creating distribution comparison: {e}")
         return False
 
+def _run_plot(plot_function):
+    """Worker entry point: build one plot in its own process."""
+    plot_name, plot_func = plot_function
+    return plot_name, plot_func()
+
 def main():
     """Main function to create all histograms."""
     print("🎯 Creating Histograms...")
@@ -446,15 +481,26 @@ def main():
     ]
     
     successful_plots = 0
+    max_workers = min(len(plot_functions), os.cpu_count() or 1)
+    
+    if max_workers > 1:
+        # The plots are independent, so render them in separate processes
+        print(f"📊 Creating {len(plot_functions)} plots in {max_workers} processes...")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_run_plot, plot_functions))
+    else:
+        results = []
+        for plot_name, plot_func in plot_functions:
+            print(f"📊 Creating {plot_name}...")
+            results.append((plot_name, plot_func()))
     
-    for plot_name, plot_func in plot_functions:
-        print(f"📊 Creating {plot_name}...")
-        if plot_func():
+    for plot_name, success in results:
+        if success:
             print(f"✅ {plot_name} created successfully!")
             successful_plots += 1
         else:
             print(f"❌ Failed to create {plot_name}")
-        print()
+    print()
     
     print(f"📈 Histogram Summary: {successful_plots}/{len(plot_functions)} plots created successfully!")
     return successful_plots == len(plot_functions)
@@ -10,14 +10,27 @@ Author: Scientific Plotting Team
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; must run before pyplot is imported
 sys.path.append('../../utils')
 
 from common_utils import *
+from plot_cache import cached_plot
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
+from hist_kernels import SINGLE_AXES_LAYOUT
 
+# Data and output directories, resolved once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, '..', 'data')
+_PLOT_DIR = os.path.join(_HERE, '..', 'plot')
+
+# Helper module whose changes also invalidate previously rendered plots
+_HIST_KERNELS_PATH = os.path.join(_HERE, 'hist_kernels.py')
+
+@cached_plot(os.path.join(_DATA_DIR, 'multiple_histogram_data.csv'), os.path.join(_PLOT_DIR, 'multiple_histograms.png'),
+             _HIST_KERNELS_PATH)
 def create_multiple_histograms():
     """
     Create overlapping histograms for multiple groups.
@@ -39,13 +52,14 @@ def create_multiple_histograms():
     """
     try:
         # Check for required CSV file
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'multiple_histogram_data.csv')
+        csv_path = os.path.join(_DATA_DIR, 'multiple_histogram_data.csv')
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Required CSV file not found: {csv_path}")
         
         # Load and validate data
-        data = pd.read_csv(csv_path)
         required_columns = ['group_a', 'group_b', 'group_c']
+        data = load_csv_cached(csv_path, usecols=required_columns,
+                               dtype=dict.fromkeys(required_columns, np.float64))
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
@@ -54,7 +68,7 @@ def create_multiple_histograms():
         set_scientific_style()
         colors = get_color_palette(3)
         
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), gridspec_kw=SINGLE_AXES_LAYOUT)
         
         # Create overlapping histograms
         groups = ['group_a', 'group_b', 'group_c']
@@ -81,8 +95,7 @@ def create_multiple_histograms():
         ax.text(0.02, 0.98, stats_text.strip(), transform=ax.transAxes, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
         
-        plt.tight_layout()
-        save_plot(fig, os.path.join(os.path.dirname(__file__), '..', 'plot', 'multiple_histograms.png'))
+        save_plot(fig, os.path.join(_PLOT_DIR, 'multiple_histograms.png'))
         plt.close()
         return True
         
@@ -1,13 +1,17 @@
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 import os
 import sys
+import functools
+import contextlib
+import tempfile
 from pathlib import Path
 
+# rcParams是进程级全局状态，样式只需在每个进程中应用一次
+@functools.lru_cache(maxsize=1)
 def set_scientific_style():
-    """设置科学绘图样式"""
+    """设置科学绘图样式（同一进程内重复调用不再重新设置）"""
     plt.style.use('seaborn-v0_8-whitegrid')
     plt.rcParams.update({
         'font.size': 12,
@@ -23,17 +27,103 @@ def set_scientific_style():
         'savefig.bbox': 'tight'
     })
 
+@functools.lru_cache(maxsize=32)
+def _cached_color_palette(n_colors):
+    """按颜色数缓存配色方案，以不可变的元组保存"""
+    # 延迟导入seaborn，只在需要配色时才加载
+    import seaborn as sns
+    return tuple(sns.color_palette("husl", n_colors))
+
 def get_color_palette(n_colors=10):
-    """获取科学绘图配色方案"""
-    return sns.color_palette("husl", n_colors)
+    """获取科学绘图配色方案（返回新列表，调用方可以修改）"""
+    return list(_cached_color_palette(n_colors))
+
+# 进程的umask，只能通过设置再恢复的方式读取
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+@contextlib.contextmanager
+def atomic_output_file(filename, buffering=-1):
+    """
+    以二进制方式打开filename的同目录临时文件，正常退出时替换filename
+    
+    写入出错或进程被中断时原文件保持不变，不会留下截断的文件
+    """
+    output_file = tempfile.NamedTemporaryFile('wb', buffering=buffering, delete=False,
+                                              dir=os.path.dirname(filename) or None,
+                                              prefix='.' + os.path.basename(filename) + '.')
+    try:
+        with output_file:
+            yield output_file
+        # 临时文件默认只有属主可读，改回按umask新建文件时的权限
+        os.chmod(output_file.name, 0o666 & ~_UMASK)
+        os.replace(output_file.name, filename)
+    except BaseException:
+        os.remove(output_file.name)
+        raise
 
-def save_plot(fig, filename, dpi=300):
-    """保存图片到指定路径"""
+def save_plot(fig, filename, dpi=300, pil_kwargs=None, metadata=None):
+    """
+    保存图片到指定路径
+    
+    pil_kwargs会传给PNG编码器（如compress_level）；metadata中值为None的键
+    （如'Software'）不会写入文件
+    """
     # 确保目录存在
     os.makedirs(os.path.dirname(filename), exist_ok=True)
-    fig.savefig(filename, dpi=dpi, bbox_inches='tight', facecolor='white')
+    extra_kwargs = {}
+    if pil_kwargs is not None:
+        extra_kwargs['pil_kwargs'] = pil_kwargs
+    if metadata is not None:
+        extra_kwargs['metadata'] = metadata
+    # 通过1 MiB缓冲的文件句柄写入，编码器的小块写入不会各自变成一次系统调用。
+    # 先写到同目录的临时文件再替换，绘制出错时不会截断已有的图片
+    image_format = os.path.splitext(filename)[1][1:].lower() or None
+    with atomic_output_file(filename, buffering=1 << 20) as image_file:
+        fig.savefig(image_file, format=image_format, dpi=dpi, bbox_inches='tight',
+                    facecolor='white', **extra_kwargs)
     print(f"Plot saved as: {filename}")
 
+@functools.lru_cache(maxsize=64)
+def _read_csv_cached(abs_path, mtime, usecols=None, dtype=None):
+    """按(绝对路径, 修改时间, 列, 类型)缓存解析结果，文件被修改后自动重新读取"""
+    if usecols is None:
+        return pd.read_csv(abs_path, dtype=dict(dtype) if dtype else None)
+    # 用可调用的usecols：缺失的列不会让pandas报错，由调用方检查并给出提示
+    wanted = frozenset(usecols)
+    return pd.read_csv(abs_path, usecols=lambda col: col in wanted,
+                       dtype=dict(dtype) if dtype else None)
+
+def load_csv_cached(csv_path, usecols=None, dtype=None):
+    """
+    读取CSV文件，同一进程内重复读取未修改的文件时直接使用缓存
+    
+    usecols只解析需要的列，dtype指定列类型以跳过类型推断。
+    返回缓存数据的副本，调用方可以随意修改；文件不存在时抛出FileNotFoundError
+    """
+    abs_path = os.path.abspath(csv_path)
+    return _read_csv_cached(abs_path, os.path.getmtime(abs_path),
+                            tuple(usecols) if usecols is not None else None,
+                            tuple(sorted(dtype.items())) if dtype else None).copy()
+
+def read_csv_columns(csv_path, dtype):
+    """
+    只读取dtype中列出的列，并按指定类型解析，跳过类型推断
+    
+    缺少列时按dtype中的顺序报告缺失的列，抛出ValueError；
+    文件不存在时抛出FileNotFoundError
+    """
+    required_columns = list(dtype)
+    try:
+        return pd.read_csv(csv_path, usecols=required_columns, dtype=dtype)
+    except ValueError:
+        # 用表头给出缺失的列，而不是pandas对usecols的报错
+        header = pd.read_csv(csv_path, nrows=0).columns
+        missing_columns = [col for col in required_columns if col not in header]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}. Required: {required_columns}")
+        raise
+
 def check_and_load_csv(csv_path, required_columns, data_description):
     """
     检查CSV文件是否存在，如果存在则加载，如果不存在则报错并说明数据格式要求
@@ -73,7 +163,12 @@ def check_and_load_csv(csv_path, required_columns, data_description):
         raise FileNotFoundError(f"数据文件不存在: {csv_path}")
     
     try:
-        df = pd.read_csv(csv_path)
+        try:
+            # 优先使用pyarrow多线程解析器
+            df = pd.read_csv(csv_path, engine='pyarrow')
+        except ImportError:
+            # 未安装pyarrow时退回默认的C解析器
+            df = pd.read_csv(csv_path)
         
         # 检查必需的列是否存在
         missing_columns = [col for col in required_columns if col not in df.columns]
@@ -0,0 +1,75 @@
+"""
+绘图结果缓存
+============
+
+根据输入CSV和绘图代码的内容哈希判断已生成的图片是否仍然有效，
+有效时跳过读取数据和绘制的全过程。绘图函数用cached_plot装饰即可。
+
+本模块只依赖标准库，检查缓存时不会加载matplotlib。
+"""
+
+import functools
+import hashlib
+import os
+
+# common_utils.py决定样式和保存参数，修改它也要让所有图片失效
+_COMMON_UTILS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'common_utils.py')
+_HASH_CHUNK_BYTES = 1 << 20
+
+def plot_cache_key(csv_path, *code_paths):
+    """
+    计算输入CSV和绘图代码的内容哈希
+
+    code_paths为生成图片所用的源文件，common_utils.py总会计入。
+    CSV不存在时抛出FileNotFoundError
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (csv_path, *code_paths, _COMMON_UTILS_PATH):
+        with open(path, 'rb') as source:
+            for chunk in iter(lambda: source.read(_HASH_CHUNK_BYTES), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def _key_path(plot_path):
+    """图片对应的哈希记录文件"""
+    return plot_path + '.key'
+
+def is_plot_current(plot_path, key):
+    """图片存在、未被替换，且由相同的数据和代码生成时返回True"""
+    try:
+        with open(_key_path(plot_path)) as key_file:
+            recorded_key, recorded_mtime = key_file.read().split()
+        return recorded_key == key and int(recorded_mtime) == os.stat(plot_path).st_mtime_ns
+    except (OSError, ValueError):
+        return False
+
+def mark_plot_current(plot_path, key):
+    """在图片旁记录生成它所用的哈希和图片的修改时间"""
+    with open(_key_path(plot_path), 'w') as key_file:
+        key_file.write(f"{key} {os.stat(plot_path).st_mtime_ns}")
+
+def cached_plot(csv_path, plot_path, *code_paths):
+    """
+    装饰器：输入CSV和绘图代码都未改变时跳过绘图函数，直接返回True
+
+    被装饰函数所在的源文件和code_paths一起计入哈希；函数返回True后记录哈希。
+    CSV不存在时照常调用函数，由它报告缺失的文件和数据格式要求
+    """
+    def decorator(plot_func):
+        sources = (os.path.abspath(plot_func.__code__.co_filename), *code_paths)
+
+        @functools.wraps(plot_func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = plot_cache_key(csv_path, *sources)
+            except FileNotFoundError:
+                return plot_func(*args, **kwargs)
+            if is_plot_current(plot_path, key):
+                print(f"⏭️  Plot is up to date: {plot_path}")
+                return True
+            success = plot_func(*args, **kwargs)
+            if success:
+                mark_plot_current(plot_path, key)
+            return success
+        return wrapper
+    return decorator